@@ -0,0 +1,90 @@
+"""
+Alembic environment for the TODO API.
+
+Migrates the database named by DATABASE_URL, or the connection passed in by
+app.migrate as config.attributes["connection"]. Each revision runs in its own
+transaction so revisions that build indexes online can step outside of it.
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.config import get_settings
+from app.database import Base, async_database_url
+from app.models.task_search import SQLITE_FTS_TABLE
+
+config = context.config
+settings = get_settings()
+target_metadata = Base.metadata
+
+# The CLI configures logging from alembic.ini; the app keeps its own
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name)
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Keep autogenerate away from objects the models do not describe."""
+    if type_ == "table" and reflected and compare_to is None:
+        # The FTS5 table and its shadow tables
+        return not name.startswith(SQLITE_FTS_TABLE)
+    if type_ == "column" and name == "search_vector":
+        return False  # PostgreSQL generated column for search
+    if type_ == "index" and name == "ix_tasks_search_vector":
+        return False
+    return True
+
+
+def configure_options(dialect_name: str) -> dict:
+    """Options shared by online and offline runs."""
+    return {
+        "target_metadata": target_metadata,
+        "include_object": include_object,
+        # SQLite cannot ALTER most things; batch mode copies the table instead
+        "render_as_batch": dialect_name == "sqlite",
+        "transaction_per_migration": True,
+        "compare_type": True,
+    }
+
+
+def run_migrations_offline():
+    """Emit the migration SQL for DATABASE_URL without connecting."""
+    url = settings.DATABASE_URL
+    context.configure(
+        url=url,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        **configure_options(make_url(url).get_backend_name()),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection):
+    """Run the migrations on an open connection."""
+    context.configure(connection=connection, **configure_options(connection.dialect.name))
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations():
+    """Connect to DATABASE_URL and run the migrations."""
+    # A plain engine: the app's SQLite profile turns foreign keys on, which
+    # would make batch mode's table copies cascade
+    engine = create_async_engine(async_database_url(settings.DATABASE_URL), poolclass=NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif "connection" in config.attributes:
+    do_run_migrations(config.attributes["connection"])
+else:
+    asyncio.run(run_async_migrations())
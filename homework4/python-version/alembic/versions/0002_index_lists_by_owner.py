@@ -0,0 +1,31 @@
+"""Index lists by owner
+
+Deleting a user cascades to their lists, and without an index on
+lists.user_id every such delete scans the lists table. Built online (see
+app.migrations.online) so existing deployments keep accepting writes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 18:25:04.112380
+
+"""
+
+from typing import Sequence, Union
+
+from app.migrations.online import create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_online("ix_lists_user_id_created_at_id", "lists", ["user_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_online("ix_lists_user_id_created_at_id", "lists")
@@ -0,0 +1,91 @@
+"""Key the SQLite task search index on stable ids
+
+The FTS5 index was keyed on the implicit rowid of tasks, whose primary key
+is a string, so VACUUM or a batch-mode copy of tasks could renumber the
+rowids and silently desync it. tasks_fts_keys now gives every task id an
+INTEGER PRIMARY KEY for the index to use. PostgreSQL is unaffected.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 18:52:41.507316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from app.models.task_search as of this revision so later edits
+# there cannot rewrite history
+DROP_SEARCH = [
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TABLE IF EXISTS tasks_fts",
+    "DROP VIEW IF EXISTS tasks_fts_source",
+    "DROP TABLE IF EXISTS tasks_fts_keys",
+]
+KEYED_SEARCH = [
+    "CREATE TABLE tasks_fts_keys (id INTEGER PRIMARY KEY, task_id VARCHAR(36) NOT NULL UNIQUE)",
+    "CREATE VIEW tasks_fts_source AS "
+    "SELECT k.id AS id, t.title AS title, t.description AS description "
+    "FROM tasks_fts_keys AS k JOIN tasks AS t ON t.id = k.task_id",
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, "
+    "content='tasks_fts_source', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts_keys(task_id) VALUES (new.id); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (last_insert_rowid(), new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "SELECT 'delete', id, old.title, old.description FROM tasks_fts_keys "
+    "WHERE task_id = old.id; "
+    "DELETE FROM tasks_fts_keys WHERE task_id = old.id; END",
+    "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "SELECT 'delete', id, old.title, old.description FROM tasks_fts_keys "
+    "WHERE task_id = old.id; "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "SELECT id, new.title, new.description FROM tasks_fts_keys WHERE task_id = new.id; END",
+    "INSERT INTO tasks_fts_keys(task_id) SELECT id FROM tasks",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+# The index as of revision 0001
+ROWID_SEARCH = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', tokenize='porter unicode61')",
+    "CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.rowid, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.rowid, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "sqlite":
+        return
+    for statement in DROP_SEARCH + KEYED_SEARCH:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "sqlite":
+        return
+    for statement in DROP_SEARCH + ROWID_SEARCH:
+        op.execute(statement)
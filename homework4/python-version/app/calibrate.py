@@ -0,0 +1,117 @@
+"""
+Calibrate Argon2 cost parameters for this host.
+
+Picks the highest time cost whose median verify latency stays within a
+target, shrinking memory cost if even a single pass is too slow, and prints
+the matching ARGON2_* settings. Memory cost never goes below OWASP's 19 MiB
+minimum for Argon2id; if a single pass at that is still too slow, the target
+is reported as unreachable instead.
+
+Usage:
+    python -m app.calibrate --target-ms 250 [--memory-cost 65536] [--parallelism 4]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from passlib.hash import argon2
+
+from app.config import get_settings
+
+MAX_TIME_COST = 20
+MIN_MEMORY_COST = 19 * 1024  # KiB, OWASP's minimum for Argon2id
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """
+    Measure median Argon2 verify latency for a parameter set.
+
+    Args:
+        time_cost: Number of iterations
+        memory_cost: Memory in KiB
+        parallelism: Number of lanes
+        samples: Number of verifications to time
+
+    Returns:
+        Median latency in milliseconds
+    """
+    hasher = argon2.using(rounds=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed = hasher.hash("calibration-password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify("calibration-password", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int, samples: int = 5):
+    """
+    Find Argon2 parameters that verify within the target latency.
+
+    Args:
+        target_ms: Maximum acceptable median verify latency
+        memory_cost: Starting memory cost in KiB
+        parallelism: Number of lanes
+        samples: Number of verifications to time per parameter set
+
+    Returns:
+        Tuple of (time_cost, memory_cost, parallelism, measured_ms)
+
+    Raises:
+        ValueError: If memory_cost is below MIN_MEMORY_COST, or a single pass
+            at MIN_MEMORY_COST is still slower than the target
+    """
+    if memory_cost < MIN_MEMORY_COST:
+        raise ValueError(
+            f"Memory cost {memory_cost} KiB is below the minimum {MIN_MEMORY_COST} KiB"
+        )
+    while True:
+        latency = measure_verify_ms(1, memory_cost, parallelism, samples)
+        if latency <= target_ms or memory_cost == MIN_MEMORY_COST:
+            break
+        memory_cost = max(memory_cost // 2, MIN_MEMORY_COST)
+    if latency > target_ms:
+        raise ValueError(
+            f"A single pass with the minimum {MIN_MEMORY_COST} KiB takes {latency:.1f} ms, "
+            f"over the {target_ms:.0f} ms target; raise the target or use a faster host"
+        )
+
+    time_cost = 1
+    while time_cost < MAX_TIME_COST:
+        next_latency = measure_verify_ms(time_cost + 1, memory_cost, parallelism, samples)
+        if next_latency > target_ms:
+            break
+        time_cost += 1
+        latency = next_latency
+
+    return time_cost, memory_cost, parallelism, latency
+
+
+def main():
+    """Command-line entry point."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--memory-cost", type=int, default=settings.ARGON2_MEMORY_COST)
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        time_cost, memory_cost, parallelism, latency = calibrate(
+            args.target_ms, args.memory_cost, args.parallelism, args.samples
+        )
+    except ValueError as exc:
+        print(f"Cannot calibrate: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(f"# median verify: {latency:.1f} ms (target {args.target_ms:.0f} ms)")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={parallelism}")
+
+
+if __name__ == "__main__":
+    main()
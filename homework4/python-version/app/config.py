@@ -5,6 +5,7 @@ Loads settings from environment variables with sensible defaults.
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -18,18 +19,76 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./data/todo.db"
+    DB_POOL_SIZE: int = 5  # server databases (PostgreSQL)
+    DB_MAX_OVERFLOW: int = 10
+    DATABASE_REPLICA_URLS: str = ""  # comma-separated read replicas for GET endpoints
+    REPLICA_RETRY_INTERVAL: float = 30.0  # seconds an unreachable replica is skipped
+
+    # SQLite profile, applied to every new connection
+    SQLITE_POOL_SIZE: int = 8  # fixed; WAL lets these read concurrently
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms a writer waits for the lock before "database is locked"
+    SQLITE_MMAP_SIZE: int = 268435456  # bytes of the file read through mmap
+    SQLITE_CACHE_SIZE: int = -65536  # page cache; negative values are KiB
 
     # JWT Configuration
     JWT_SECRET: str = "your-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRY: int = 3600  # 1 hour in seconds
 
+    # Token revocation cache
+    REVOCATION_CACHE_MAX_SIZE: int = 100000
+    REVOCATION_SYNC_INTERVAL: float = 5.0  # seconds between blacklist syncs
+    REVOCATION_BLOOM_BITS: int = 1 << 20
+    REVOCATION_BLOOM_HASHES: int = 7
+
+    # Authenticated user cache
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL: float = 60.0  # seconds
+
     # Password Hashing
-    BCRYPT_ROUNDS: int = 12
+    BCRYPT_ROUNDS: int = 12  # Unused: passwords are hashed with Argon2 (see ARGON2_*)
+    ARGON2_TIME_COST: int = 3  # iterations
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4  # lanes
+    PASSWORD_HASH_WORKERS: int = 4  # threads dedicated to Argon2
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # waiting jobs before returning 429
 
     # API Settings
     API_V1_PREFIX: str = "/api/v1"
 
+    # Production server (python -m app.server)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0  # 0 = one per available CPU
+    SERVER_BACKLOG: int = 2048  # pending connections; capped by net.core.somaxconn
+    SERVER_KEEPALIVE: int = 75  # idle keep-alive seconds; keep above the proxy's (nginx: 60)
+    SERVER_TIMEOUT: int = 60  # seconds before an unresponsive worker is restarted
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # seconds workers get to finish requests on shutdown
+    SERVER_MAX_REQUESTS: int = 0  # recycle workers after this many requests; 0 = never
+
+    # Observability
+    QUERY_BUDGET: int = 0  # log requests running more statements than this; 0 disables
+
+    # Responses
+    ORJSON_RESPONSES: bool = True  # orjson for list/task responses, skipping re-validation
+
+    # Pagination
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+
+    # Batch operations
+    BATCH_MAX_OPERATIONS: int = 5000
+
+    # Change feed
+    TOMBSTONE_RETENTION_REVISIONS: int = 10000  # list revisions deleted tasks stay in the feed
+
+    # Pushed task events
+    EVENT_QUEUE_SIZE: int = 256  # events buffered per subscriber before it is evicted
+    EVENT_HEARTBEAT_INTERVAL: float = 15.0  # seconds between keepalives on idle streams
+    EVENT_BROKER: str = "local"  # or "package.module:ClassName" for multi-worker fan-out
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,44 +2,314 @@
 Database connection and session management.
 """
 
-from sqlalchemy import create_engine
+import logging
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from sqlalchemy.sql.dml import UpdateBase
 from app.config import get_settings
+from app.metrics import instrument_engine
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Async drivers used when DATABASE_URL names a plain backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    Map a database URL onto its asyncio driver.
+
+    URLs that already name a driver (e.g. sqlite+aiosqlite://) are returned unchanged.
+
+    Args:
+        url: Database URL from settings
+
+    Returns:
+        Database URL using an asyncio-compatible driver
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Pool options for an engine on the given database.
+
+    SQLite files get a fixed-size pool without pre-ping: connections to a
+    local file do not go stale, and WAL lets pooled connections read while
+    one writes. In-memory SQLite shares a single connection so every session
+    sees the same database. Server databases keep an overflowing pool with
+    pre-ping to survive dropped network connections.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return {
+            "pool_pre_ping": True,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+        }
+    if parsed.database in (None, "", ":memory:"):
+        return {"poolclass": StaticPool}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.SQLITE_POOL_SIZE,
+        "max_overflow": 0,
+        "pool_pre_ping": False,
+    }
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """PRAGMA settings applied to every new SQLite connection, in order."""
+    return {
+        # SQLite ignores ON DELETE CASCADE unless this is on per connection;
+        # deletes of lists rely on it to remove their tasks
+        "foreign_keys": "ON",
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+    }
+
+
+def install_sqlite_pragmas(async_engine: AsyncEngine):
+    """
+    Apply the SQLite profile (see sqlite_pragmas) to every new connection.
+
+    WAL lets readers proceed while a write is in progress, synchronous=NORMAL
+    is durable under WAL except for the last commits on power loss, and
+    busy_timeout makes concurrent writers queue instead of failing with
+    "database is locked".
+
+    Args:
+        async_engine: Engine to configure; non-SQLite engines are left alone
+    """
+    if async_engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def create_engine_for(url: str, name: str = "primary") -> AsyncEngine:
+    """
+    Create an engine with the pool options and SQLite profile for a URL.
+
+    Args:
+        url: Database URL from settings
+        name: Label for the engine's metrics
+
+    Returns:
+        Configured async engine
+    """
+    async_engine = create_async_engine(async_database_url(url), **engine_options(url))
+    install_sqlite_pragmas(async_engine)
+    instrument_engine(async_engine, name)
+    return async_engine
+
+
+class ReplicaSet:
+    """Round-robin choice among read replicas, skipping ones that recently failed."""
+
+    def __init__(self, engines: List[AsyncEngine], retry_interval: float):
+        self.engines = engines
+        self.retry_interval = retry_interval
+        self._down_until: Dict[int, float] = {}
+        self._next = 0
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    def choose(self) -> Optional[AsyncEngine]:
+        """
+        Pick the next healthy replica.
+
+        Returns:
+            Replica engine, or None if none are configured or all are down
+        """
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.engines)
+            if self._down_until.get(index, 0.0) <= now:
+                return self.engines[index]
+        return None
+
+    def mark_down(self, replica: AsyncEngine):
+        """Skip a replica for retry_interval seconds."""
+        self._down_until[self.engines.index(replica)] = time.monotonic() + self.retry_interval
+
+    def stats(self) -> Dict[str, int]:
+        """Number of configured replicas and of those not marked down."""
+        now = time.monotonic()
+        down = sum(1 for until in self._down_until.values() if until > now)
+        return {"configured": len(self.engines), "available": len(self.engines) - down}
+
+    async def dispose(self):
+        """Close every replica's connection pool."""
+        for replica in self.engines:
+            await replica.dispose()
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica and writes to the primary.
+
+    Statements go to the replica until the session first writes (a flush or
+    an INSERT/UPDATE/DELETE); from then on every statement, reads included,
+    goes to the primary so the request sees its own writes.
+    """
+
+    def __init__(self, *args: Any, replica: Optional[Engine] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+
+    def use_primary(self):
+        """Send every later statement to the primary."""
+        self.replica = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is not None and (self._flushing or isinstance(clause, UpdateBase)):
+            self.use_primary()
+        if self.replica is not None:
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+class ReadSession(AsyncSession):
+    """
+    Async RoutingSession that falls back to the primary when its replica fails.
+
+    Like any session it connects on its first statement, so requests that
+    never query never touch the replica. A statement that fails on the
+    replica with a connection or operational error marks the replica down
+    and is retried on the primary, along with the rest of the session.
+    Errors in the statement itself (e.g. IntegrityError) are raised as usual.
+    """
+
+    def __init__(self, *args: Any, replica: Optional[AsyncEngine] = None, **kwargs: Any):
+        super().__init__(*args, replica=replica.sync_engine if replica else None, **kwargs)
+        self.replica = replica
+
+    async def _read(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await call()
+        except (OperationalError, InterfaceError, OSError) as exc:
+            # After a write the session is on the primary: nothing to fall back to
+            if self.replica is None or self.sync_session.replica is None:
+                raise
+            logger.warning(f"Read replica unavailable, using primary: {exc}")
+            replicas.mark_down(self.replica)
+            self.replica = None
+            await self.rollback()
+            self.sync_session.use_primary()
+            return await call()
+
+    async def execute(self, *args: Any, **kwargs: Any):
+        return await self._read(partial(super().execute, *args, **kwargs))
+
+    async def scalar(self, *args: Any, **kwargs: Any):
+        return await self._read(partial(super().scalar, *args, **kwargs))
+
+    async def get(self, *args: Any, **kwargs: Any):
+        return await self._read(partial(super().get, *args, **kwargs))
+
+
+# Create database engines
+engine = create_engine_for(settings.DATABASE_URL)
+replicas = ReplicaSet(
+    [
+        create_engine_for(url, f"replica{index}")
+        for index, url in enumerate(
+            url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()
+        )
+    ],
+    retry_interval=settings.REPLICA_RETRY_INTERVAL,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factories. Objects keep their state after commit: ids and
+# timestamps are generated in Python, so responses can be built from the
+# in-memory object without a second SELECT.
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+ReadSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=ReadSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Create declarative base for models
 Base = declarative_base()
 
+# Set once init_db has run in this process or, under app.server, in the
+# master the worker was forked from
+_db_initialized = False
+
 
-def get_db() -> Session:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Database dependency for FastAPI endpoints.
     Yields a database session and ensures cleanup.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def get_read_db() -> AsyncIterator[AsyncSession]:
     """
-    Initialize database tables.
-    Creates all tables defined by SQLAlchemy models.
+    Database dependency for read-only endpoints.
+
+    Yields a session routed to a read replica, or to the primary when no
+    replica is configured or reachable (see ReadSession). Replicas may lag
+    the primary, so handlers that must see a write from an earlier request
+    use get_db.
+    """
+    async with ReadSessionLocal(replica=replicas.choose()) as db:
+        yield db
+
+
+async def init_db():
+    """
+    Initialize the database schema.
+    Applies pending Alembic migrations (see app.migrate).
+
+    Does nothing if the database was already initialized by this process or
+    the process it was forked from.
     """
-    from app.models import user, list, task, token_blacklist
-    Base.metadata.create_all(bind=engine)
+    global _db_initialized
+    if _db_initialized:
+        return
+    from app.migrate import upgrade_database
+
+    await upgrade_database(engine)
+    _db_initialized = True
@@ -3,8 +3,9 @@ Main FastAPI application entry point.
 """
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
+from prometheus_client import CONTENT_TYPE_LATEST
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
 import logging
@@ -13,7 +14,14 @@ from datetime import datetime
 
 from app.config import get_settings
 from app.database import init_db
-from app.routers import auth, users, lists, tasks
+from app.metrics import (
+    REQUESTS_IN_PROGRESS,
+    observe_request,
+    render_metrics,
+    route_label,
+    track_request_queries,
+)
+from app.routers import auth, users, lists, tasks, events
 
 settings = get_settings()
 
@@ -37,21 +45,40 @@ app = FastAPI(
 # Middleware for request logging
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all incoming requests and their processing time."""
-    start_time = time.time()
-
-    # Process request
-    response = await call_next(request)
-
-    # Calculate processing time
-    process_time = time.time() - start_time
+    """Log all incoming requests and record their latency and database work."""
+    queries = track_request_queries()
+    in_progress = REQUESTS_IN_PROGRESS.labels(request.method)
+    in_progress.inc()
+    start_time = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        # Process request
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        in_progress.dec()
+        # Calculate processing time
+        process_time = time.perf_counter() - start_time
+        observe_request(request, status_code, process_time, queries)
 
     # Log request details
     logger.info(
-        f"{request.method} {request.url.path} - "
-        f"Status: {response.status_code} - "
-        f"Time: {process_time:.3f}s"
+        "%s %s - Status: %d - Time: %.3fs - Queries: %d (%.3fs)",
+        request.method,
+        request.url.path,
+        status_code,
+        process_time,
+        queries.count,
+        queries.seconds,
     )
+    if settings.QUERY_BUDGET and queries.count > settings.QUERY_BUDGET:
+        logger.warning(
+            "Query budget exceeded: %s %s ran %d statements (budget %d)",
+            request.method,
+            route_label(request),
+            queries.count,
+            settings.QUERY_BUDGET,
+        )
 
     return response
 
@@ -105,19 +132,27 @@ async def health_check():
     """
     Check the health and status of the API and its dependencies.
     """
-    from app.database import engine
+    from app.database import engine, replicas
+    from app.services.events import event_hub
+    from app.services.hashing import password_executor
     import psutil
 
     # Check database connection
     db_status = "healthy"
     db_message = "Database connection successful"
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
     except Exception as e:
         db_status = "unhealthy"
         db_message = f"Database connection failed: {str(e)}"
 
+    # Reads fall back to the primary, so an unreachable replica only degrades service
+    replica_stats = replicas.stats()
+    replica_status = (
+        "healthy" if replica_stats["available"] == replica_stats["configured"] else "degraded"
+    )
+
     # Get system stats
     disk_usage = psutil.disk_usage("/")
     memory = psutil.virtual_memory()
@@ -150,25 +185,44 @@ async def health_check():
                     "memory_usage_mb": round((memory.total - memory.available) / (1024 * 1024)),
                     "memory_available_mb": round(memory.available / (1024 * 1024)),
                 },
+                "password_hashing": {
+                    "status": "healthy",
+                    **password_executor.stats(),
+                },
+                "read_replicas": {"status": replica_status, **replica_stats},
+                "events": {"status": "healthy", **event_hub.stats()},
             },
         },
     )
 
 
+# Prometheus metrics endpoint
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics():
+    """
+    Expose request, database, threadpool and crypto metrics for Prometheus.
+    """
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Include routers
-app.include_router(auth.router, prefix=settings.API_V1_PREFIX, tags=["Authentication"])
-app.include_router(users.router, prefix=settings.API_V1_PREFIX, tags=["Users"])
-app.include_router(lists.router, prefix=settings.API_V1_PREFIX, tags=["Lists"])
-app.include_router(tasks.router, prefix=settings.API_V1_PREFIX, tags=["Tasks"])
+app.include_router(auth.router, tags=["Authentication"])
+app.include_router(users.router, tags=["Users"])
+app.include_router(lists.router, tags=["Lists"])
+app.include_router(tasks.router, tags=["Tasks"])
+app.include_router(events.router, tags=["Events"])
 
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database on startup, unless app.server already did."""
     logger.info("Starting application...")
-    init_db()
+    await init_db()
     logger.info("Database initialized")
+    from app.services.events import event_hub
+
+    await event_hub.start()
 
 
 # Shutdown event
@@ -176,6 +230,16 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down application...")
+    from app.services.hashing import password_executor
+
+    password_executor.shutdown()
+    from app.services.events import event_hub
+
+    await event_hub.stop()
+    from app.database import engine, replicas
+
+    await engine.dispose()
+    await replicas.dispose()
 
 
 # Root endpoint
@@ -0,0 +1,321 @@
+"""
+Prometheus metrics for requests, database work and password/JWT crypto.
+
+Request metrics are recorded by the middleware in app.main, database metrics
+by SQLAlchemy events installed with instrument_engine, and gauges of pools
+and thread usage are refreshed when /metrics is scraped.
+
+When PROMETHEUS_MULTIPROC_DIR is set (app.server sets it for more than one
+worker), every worker writes its samples there and /metrics reports the sum
+over live workers. Sampled gauges then reflect each worker as of the last
+scrape it served.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+from weakref import WeakKeyDictionary
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+# Latency buckets from sub-millisecond cache hits to multi-second slow requests
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 4, 6, 8, 12, 16, 25, 50, 100)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to produce a response, by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database statements executed per request",
+    ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_QUERY_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time per request spent executing database statements",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Latency of individual database statements",
+    ["engine", "statement"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time sessions waited for a pooled connection, including opening new ones",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured connection pool size", ["engine"], multiprocess_mode="livesum"
+)
+
+THREADPOOL_BUSY = Gauge(
+    "threadpool_busy_threads",
+    "Worker threads running sync endpoints and dependencies",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_LIMIT = Gauge(
+    "threadpool_max_threads", "Size of the sync endpoint threadpool", multiprocess_mode="livesum"
+)
+THREADPOOL_QUEUED = Gauge(
+    "threadpool_queue_depth",
+    "Sync calls waiting for a threadpool worker",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Argon2 hash/verify time on the password executor",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password work waited for a free executor thread",
+    buckets=LATENCY_BUCKETS,
+)
+PASSWORD_HASH_QUEUED = Gauge(
+    "password_hash_queue_depth",
+    "Password jobs waiting for an executor thread",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected", "Password jobs rejected with 429 because the executor was full"
+)
+JWT_DURATION = Histogram(
+    "jwt_duration_seconds",
+    "JWT signing and verification time",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@dataclass
+class QueryStats:
+    """Database statements executed on behalf of one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+_request_queries: ContextVar[Optional[QueryStats]] = ContextVar("request_queries", default=None)
+
+
+@dataclass
+class QueryCounter:
+    """Statements executed on any instrumented engine while the counter is active."""
+
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        return len(self.statements)
+
+
+_active_counters: List[QueryCounter] = []
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Record every statement executed while the block runs, in any task or thread.
+
+    Unlike the per-request stats this is not tied to a context, so tests can
+    count the statements behind requests served on another thread.
+
+    Yields:
+        Counter filled in as statements complete
+    """
+    counter = QueryCounter()
+    _active_counters.append(counter)
+    try:
+        yield counter
+    finally:
+        _active_counters.remove(counter)
+
+
+def track_request_queries() -> QueryStats:
+    """
+    Start counting database statements for the current request.
+
+    Statements run in tasks and greenlets spawned from this context are
+    counted too.
+
+    Returns:
+        Stats object filled in as statements complete
+    """
+    stats = QueryStats()
+    _request_queries.set(stats)
+    return stats
+
+
+def route_label(request: Request) -> str:
+    """Route template of a handled request, e.g. /api/v1/tasks/{task_id}."""
+    # Unmatched paths share one label so scanners cannot blow up cardinality
+    route = request.scope.get("route")
+    if route is None:
+        return "<unmatched>"
+    # Routers carry the API prefix themselves (see app.routers), so this is
+    # the full template
+    return route.path
+
+
+def observe_request(request: Request, status_code: int, seconds: float, queries: QueryStats):
+    """Record a finished request's latency and database work."""
+    method = request.method
+    route = route_label(request)
+    REQUEST_DURATION.labels(method, route, str(status_code)).observe(seconds)
+    REQUEST_QUERIES.labels(method, route).observe(queries.count)
+    REQUEST_QUERY_DURATION.labels(method, route).observe(queries.seconds)
+
+
+# Engines instrumented by instrument_engine, by the "engine" label
+_engine_names: "WeakKeyDictionary[Engine, str]" = WeakKeyDictionary()
+
+
+# Pool events fire only once a connection is checked out, so checkout wait
+# is timed from the session's side: from the statement or flush that needs a
+# connection until after_begin reports the session got one
+@event.listens_for(Session, "do_orm_execute")
+def _start_checkout_timer(orm_execute_state):
+    orm_execute_state.session.info["checkout_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "before_flush")
+def _start_flush_checkout_timer(session, flush_context, instances):
+    session.info["checkout_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_begin")
+def _record_checkout_wait(session, transaction, connection):
+    started = session.info.pop("checkout_started", None)
+    name = _engine_names.get(connection.engine)
+    if started is not None and name is not None:
+        DB_POOL_WAIT.labels(name).observe(time.perf_counter() - started)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_checkout_timer(session, transaction):
+    # Statements that ran on an already checked out connection
+    session.info.pop("checkout_started", None)
+
+
+def instrument_engine(async_engine: AsyncEngine, name: str):
+    """
+    Record statement latency and pool checkout wait for an engine.
+
+    Checkout wait is recorded for connections sessions check out; it covers
+    the pools dispose() swaps in, as app.server does around forking.
+
+    Args:
+        async_engine: Engine to instrument
+        name: Value of the "engine" label, e.g. "primary" or "replica0"
+    """
+    sync_engine = async_engine.sync_engine
+    _engine_names[sync_engine] = name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        DB_QUERY_DURATION.labels(name, verb).observe(elapsed)
+        stats = _request_queries.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+        for counter in _active_counters:
+            counter.statements.append(statement)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _drop_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+def _update_gauges():
+    """Refresh gauges that are sampled rather than updated as events happen."""
+    from anyio.to_thread import current_default_thread_limiter
+
+    from app.database import engine, replicas
+    from app.services.hashing import password_executor
+
+    limiter = current_default_thread_limiter()
+    statistics = limiter.statistics()
+    THREADPOOL_BUSY.set(statistics.borrowed_tokens)
+    THREADPOOL_LIMIT.set(statistics.total_tokens)
+    THREADPOOL_QUEUED.set(statistics.tasks_waiting)
+
+    engines = [("primary", engine)] + [
+        (f"replica{index}", replica) for index, replica in enumerate(replicas.engines)
+    ]
+    for name, async_engine in engines:
+        pool = async_engine.sync_engine.pool
+        if hasattr(pool, "checkedout"):
+            DB_POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+            DB_POOL_SIZE.labels(name).set(pool.size())
+
+    PASSWORD_HASH_QUEUED.set(password_executor.stats()["queued"])
+
+
+def render_metrics() -> bytes:
+    """
+    Render every metric in the Prometheus text format.
+
+    Must be called from the event loop, which owns the threadpool limiter.
+    """
+    _update_gauges()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
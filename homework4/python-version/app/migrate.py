@@ -0,0 +1,142 @@
+"""
+Bring the database schema up to date with Alembic.
+
+app.server runs this once in the master before forking workers; a single
+process server (uvicorn) runs it from init_db on startup. A database that
+is already at head costs a handful of cheap statements.
+
+Databases created before Alembic have tables but no alembic_version. They
+are completed with the idempotent steps in app.migrations, which make them
+match the current models, and stamped at head, as Alembic recommends for
+databases built with create_all.
+
+Usage:
+    python -m app.migrate [--revision head]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini"
+)
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """
+    Alembic configuration from alembic.ini.
+
+    Args:
+        connection: Connection for env.py to migrate instead of opening its own
+
+    Returns:
+        Config for alembic.command functions
+    """
+    config = Config(ALEMBIC_INI)
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def head_revision() -> str:
+    """Latest revision under alembic/versions."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(conn: Connection) -> Optional[str]:
+    """Revision the database is stamped with, or None if it is unversioned."""
+    return MigrationContext.configure(conn).get_current_revision()
+
+
+def _is_legacy(conn: Connection) -> bool:
+    tables = set(inspect(conn).get_table_names())
+    return "users" in tables and "alembic_version" not in tables
+
+
+async def _complete_legacy_schema(conn: AsyncConnection):
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from app.migrations import (
+        add_missing_columns,
+        backfill_task_categories,
+        create_missing_indexes,
+        install_task_search,
+    )
+
+    async with conn.begin():
+        await conn.run_sync(Base.metadata.create_all)
+        await add_missing_columns(conn)
+        await create_missing_indexes(conn)
+        await install_task_search(conn)
+        await backfill_task_categories(conn)
+    await conn.run_sync(lambda sync_conn: command.stamp(alembic_config(sync_conn), "head"))
+    await conn.commit()
+    logger.info("Stamped pre-Alembic database at head")
+
+
+async def upgrade_database(engine: AsyncEngine, revision: str = "head"):
+    """
+    Migrate a database to a revision, adopting pre-Alembic databases first.
+
+    Args:
+        engine: Engine of the database to migrate
+        revision: Target revision
+    """
+    async with engine.connect() as conn:
+        sqlite = conn.dialect.name == "sqlite"
+        if sqlite:
+            # Batch mode copies tables; with foreign keys on, dropping the old
+            # copy would cascade into child tables. Only takes effect outside
+            # a transaction, hence the commit.
+            await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            await conn.commit()
+        try:
+            legacy = await conn.run_sync(_is_legacy)
+            await conn.commit()
+            if legacy:
+                await _complete_legacy_schema(conn)
+            await conn.run_sync(
+                lambda sync_conn: command.upgrade(alembic_config(sync_conn), revision)
+            )
+            await conn.commit()
+        finally:
+            if sqlite:
+                await conn.rollback()
+                await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+                await conn.commit()
+
+
+async def _main(revision: str):
+    from app.database import engine
+
+    await upgrade_database(engine, revision)
+    async with engine.connect() as conn:
+        print(f"Database at revision {await conn.run_sync(current_revision)}")
+    await engine.dispose()
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--revision", default="head", help="target revision (default: head)")
+    args = parser.parse_args()
+    asyncio.run(_main(args.revision))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Steps completing databases created before Alembic, and helpers for revisions.
+
+Schema changes are Alembic revisions under alembic/versions, applied by
+app.migrate. These idempotent steps only bring a pre-Alembic database up to
+the current models before it is stamped.
+"""
+
+from app.migrations.columns import add_missing_columns
+from app.migrations.indexes import create_missing_indexes
+from app.migrations.search import install_task_search
+from app.migrations.task_categories import backfill_task_categories
+
+__all__ = [
+    "add_missing_columns",
+    "create_missing_indexes",
+    "install_task_search",
+    "backfill_task_categories",
+]
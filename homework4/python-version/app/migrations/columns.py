@@ -0,0 +1,69 @@
+"""
+Add columns declared on models but missing from existing tables.
+
+create_all never alters a table that already exists, so databases created
+before a column was added to a model never get it. Only additive changes
+are handled: new columns must be nullable or have a server default.
+
+Usage:
+    python -m app.migrations.columns
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateColumn
+
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _add_missing_columns(conn: Connection) -> int:
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    added = 0
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            definition = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(
+                text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}")
+            )
+            logger.info(f"Added column {table.name}.{column.name}")
+            added += 1
+    return added
+
+
+async def add_missing_columns(conn: AsyncConnection) -> int:
+    """
+    Add every model column that does not exist yet.
+
+    Args:
+        conn: Connection inside a transaction
+
+    Returns:
+        Number of columns added
+    """
+    return await conn.run_sync(_add_missing_columns)
+
+
+async def _main():
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from app.database import engine
+
+    async with engine.begin() as conn:
+        added = await add_missing_columns(conn)
+    print(f"Added {added} columns")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
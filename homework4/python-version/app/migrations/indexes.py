@@ -0,0 +1,62 @@
+"""
+Create indexes declared on models but missing from existing tables.
+
+create_all only builds indexes together with a new table, so databases
+created before an index was added to a model never get it.
+
+Usage:
+    python -m app.migrations.indexes
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _create_missing_indexes(conn: Connection) -> int:
+    inspector = inspect(conn)
+    created = 0
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                logger.info(f"Created index {index.name}")
+                created += 1
+    return created
+
+
+async def create_missing_indexes(conn: AsyncConnection) -> int:
+    """
+    Create every model index that does not exist yet.
+
+    Args:
+        conn: Connection inside a transaction
+
+    Returns:
+        Number of indexes created
+    """
+    return await conn.run_sync(_create_missing_indexes)
+
+
+async def _main():
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from app.database import engine
+
+    async with engine.begin() as conn:
+        created = await create_missing_indexes(conn)
+    print(f"Created {created} indexes")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
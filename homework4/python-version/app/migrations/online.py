@@ -0,0 +1,76 @@
+"""
+Index operations for Alembic revisions that must not block writes.
+
+PostgreSQL builds the index with CREATE INDEX CONCURRENTLY, which cannot run
+inside a transaction, so the revision's transaction is committed first and
+the statement runs in autocommit. SQLite has no online index build; the
+index is created through batch mode, which never copies the table for an
+index, and holds the write lock only while it builds. Readers are not
+blocked under WAL.
+
+Usage, in a revision:
+    from app.migrations.online import create_index_online, drop_index_online
+
+    def upgrade():
+        create_index_online("ix_lists_user_id", "lists", ["user_id"])
+
+    def downgrade():
+        drop_index_online("ix_lists_user_id", "lists")
+"""
+
+from typing import Any, List
+
+from alembic import op
+
+
+def create_index_online(index_name: str, table_name: str, columns: List[str], **kw: Any):
+    """
+    Create an index without blocking writes where the database allows it.
+
+    Does nothing if the index already exists, so a revision interrupted
+    after the index was built can be rerun. A concurrent build that fails
+    leaves an INVALID index behind on PostgreSQL; drop it before rerunning.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table to index
+        columns: Indexed columns, in order
+        **kw: Further op.create_index options, e.g. unique=True
+    """
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kw,
+            )
+    elif dialect == "sqlite":
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.create_index(index_name, columns, if_not_exists=True, **kw)
+    else:
+        op.create_index(index_name, table_name, columns, if_not_exists=True, **kw)
+
+
+def drop_index_online(index_name: str, table_name: str):
+    """
+    Drop an index without blocking writes where the database allows it.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table the index belongs to
+    """
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True
+            )
+    elif dialect == "sqlite":
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_index(index_name, if_exists=True)
+    else:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
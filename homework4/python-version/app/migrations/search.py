@@ -0,0 +1,84 @@
+"""
+Add the task search index to a database created before it existed.
+
+New databases get the index when the tasks table is created; this builds it
+for existing ones and indexes the tasks already stored.
+
+Usage:
+    python -m app.migrations.search [--rebuild]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.task_search import (
+    POSTGRES_SEARCH_DDL,
+    SQLITE_FTS_KEYS_TABLE,
+    SQLITE_SEARCH_DDL,
+    SQLITE_SEARCH_DROP,
+    SQLITE_SEARCH_REBUILD,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _install_task_search(conn: Connection, rebuild: bool) -> bool:
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        created = not inspect(conn).has_table(SQLITE_FTS_KEYS_TABLE)
+        if created:
+            # Replaces an index keyed on tasks.rowid, if there is one
+            for statement in SQLITE_SEARCH_DROP:
+                conn.execute(text(statement))
+        for statement in SQLITE_SEARCH_DDL:
+            conn.execute(text(statement))
+        if created or rebuild:
+            for statement in SQLITE_SEARCH_REBUILD:
+                conn.execute(text(statement))
+        return created or rebuild
+    if dialect == "postgresql":
+        columns = {column["name"] for column in inspect(conn).get_columns("tasks")}
+        for statement in POSTGRES_SEARCH_DDL:
+            conn.execute(text(statement))
+        return "search_vector" not in columns
+    return False
+
+
+async def install_task_search(conn: AsyncConnection, rebuild: bool = False) -> bool:
+    """
+    Create the task search index if missing and index existing tasks.
+
+    Args:
+        conn: Connection inside a transaction, after the tasks table exists
+        rebuild: Re-index every task even if the index already exists (SQLite)
+
+    Returns:
+        True if tasks were (re)indexed
+    """
+    indexed = await conn.run_sync(_install_task_search, rebuild)
+    if indexed:
+        logger.info("Indexed tasks for full-text search")
+    return indexed
+
+
+async def _main():
+    from app.database import Base, engine
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rebuild", action="store_true", help="re-index every task")
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        indexed = await install_task_search(conn, rebuild=args.rebuild)
+    print("Indexed tasks" if indexed else "Search index already up to date")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
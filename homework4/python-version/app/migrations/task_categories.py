@@ -0,0 +1,84 @@
+"""
+Backfill task_categories from the legacy JSON categories column.
+
+Idempotent: each migrated task has its JSON column cleared, so reruns only
+pick up rows that have not been converted yet.
+
+Usage:
+    python -m app.migrations.task_categories
+"""
+
+import asyncio
+import json
+import logging
+
+from sqlalchemy import select, insert, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.task import Task
+from app.models.task_category import TaskCategory
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_task_categories(conn: AsyncConnection, batch_size: int = 1000) -> int:
+    """
+    Move JSON-encoded categories into task_categories rows.
+
+    Args:
+        conn: Connection inside a transaction
+        batch_size: Number of tasks converted per round
+
+    Returns:
+        Number of tasks migrated
+    """
+    migrated = 0
+    while True:
+        result = await conn.execute(
+            select(Task.id, Task.legacy_categories)
+            .where(Task.legacy_categories.is_not(None))
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        category_rows = []
+        for task_id, raw in rows:
+            try:
+                categories = json.loads(raw)
+            except (json.JSONDecodeError, TypeError):
+                categories = []
+            if not isinstance(categories, list):
+                categories = []
+            category_rows.extend(
+                {"task_id": task_id, "position": position, "category": str(category)}
+                for position, category in enumerate(categories)
+            )
+
+        if category_rows:
+            await conn.execute(insert(TaskCategory), category_rows)
+        await conn.execute(
+            update(Task)
+            .where(Task.id.in_([task_id for task_id, _ in rows]))
+            .values(legacy_categories=None)
+        )
+        migrated += len(rows)
+
+    if migrated:
+        logger.info(f"Backfilled categories for {migrated} tasks")
+    return migrated
+
+
+async def _main():
+    from app.database import Base, engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        migrated = await backfill_task_categories(conn)
+    print(f"Migrated categories for {migrated} tasks")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
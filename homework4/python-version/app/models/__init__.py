@@ -5,6 +5,9 @@ SQLAlchemy database models.
 from app.models.user import User
 from app.models.list import TodoList
 from app.models.task import Task
+from app.models.task_category import TaskCategory
+from app.models.task_tombstone import TaskTombstone
 from app.models.token_blacklist import TokenBlacklist
+from app.models import task_search  # noqa: F401 - registers the search index DDL
 
-__all__ = ["User", "TodoList", "Task", "TokenBlacklist"]
+__all__ = ["User", "TodoList", "Task", "TaskCategory", "TaskTombstone", "TokenBlacklist"]
@@ -2,7 +2,7 @@
 TodoList database model.
 """
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -14,6 +14,13 @@ class TodoList(Base):
     """TodoList model for organizing tasks."""
 
     __tablename__ = "lists"
+    __table_args__ = (
+        # Keyset pagination order for GET /lists
+        Index("ix_lists_created_at_id", "created_at", "id"),
+        # A user's lists in pagination order; also serves the ON DELETE CASCADE
+        # lookup from users, which would otherwise scan every list
+        Index("ix_lists_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
@@ -21,10 +28,17 @@ class TodoList(Base):
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
+    # Bumped on every change to the list or its tasks; validates task listings
+    # and orders the change feed
+    revision = Column(Integer, default=0, server_default="0", nullable=False)
+    changed_at = Column(DateTime, nullable=True)
 
     # Relationships
     owner = relationship("User", back_populates="lists")
-    tasks = relationship("Task", back_populates="list", cascade="all, delete-orphan")
+    # Tasks are removed by the database's ON DELETE CASCADE, not loaded and deleted one by one
+    tasks = relationship(
+        "Task", back_populates="list", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<TodoList(id={self.id}, name={self.name})>"
@@ -2,14 +2,24 @@
 Task database model.
 """
 
-from sqlalchemy import Column, String, DateTime, Text, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Text,
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
-import json
 
 from app.database import Base
+from app.models.task_category import TaskCategory
 
 
 class PriorityEnum(str, enum.Enum):
@@ -24,6 +34,15 @@ class Task(Base):
     """Task model representing individual todo items."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination order for GET /lists/{list_id}/tasks
+        Index("ix_tasks_list_id_created_at_id", "list_id", "created_at", "id"),
+        # Open/completed filters with due-date ranges and ordering
+        Index("ix_tasks_list_id_completed_due_date", "list_id", "completed", "due_date"),
+        Index("ix_tasks_list_id_priority", "list_id", "priority"),
+        # Change feed scan: tasks in a list written after a revision
+        Index("ix_tasks_list_id_revision_id", "list_id", "revision", "id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     list_id = Column(String(36), ForeignKey("lists.id", ondelete="CASCADE"), nullable=False)
@@ -32,30 +51,36 @@ class Task(Base):
     completed = Column(Boolean, default=False, nullable=False)
     due_date = Column(DateTime, nullable=True)
     priority = Column(SQLEnum(PriorityEnum), nullable=True)
-    categories = Column(Text, nullable=True)
+    # Legacy JSON-encoded categories; migrated into task_categories and no longer written
+    legacy_categories = Column("categories", Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
+    # The list's revision at this task's last write
+    revision = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Relationships
     list = relationship("TodoList", back_populates="tasks")
+    # Loaded with one extra query per result set, never per row
+    category_rows = relationship(
+        TaskCategory,
+        order_by=TaskCategory.position,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
 
     @property
     def categories_list(self):
         """Get categories as a list."""
-        if self.categories:
-            try:
-                return json.loads(self.categories)
-            except (json.JSONDecodeError, TypeError):
-                return []
-        return []
+        return [row.category for row in self.category_rows]
 
     @categories_list.setter
     def categories_list(self, value):
         """Set categories from a list."""
-        if value:
-            self.categories = json.dumps(value)
-        else:
-            self.categories = None
+        self.category_rows = [
+            TaskCategory(category=category, position=position)
+            for position, category in enumerate(value or [])
+        ]
 
     def __repr__(self):
         return f"<Task(id={self.id}, title={self.title})>"
@@ -0,0 +1,27 @@
+"""
+TaskCategory database model.
+"""
+
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+
+from app.database import Base
+
+
+class TaskCategory(Base):
+    """One category tag on a task, in the order the client supplied."""
+
+    __tablename__ = "task_categories"
+    __table_args__ = (
+        # "Tasks tagged X" lookups
+        Index("ix_task_categories_category_task_id", "category", "task_id"),
+        # Loading a page of tasks' categories in order
+        Index("ix_task_categories_task_id_position", "task_id", "position"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(String(36), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)
+    category = Column(String(50), nullable=False)
+
+    def __repr__(self):
+        return f"<TaskCategory(task_id={self.task_id}, category={self.category})>"
@@ -0,0 +1,74 @@
+"""
+Full-text search index over task titles and descriptions.
+
+SQLite keeps an FTS5 table kept in sync by triggers. Its rows are keyed by
+tasks_fts_keys, which gives every task id a stable INTEGER PRIMARY KEY: the
+implicit rowid of tasks (whose primary key is a string) may be renumbered by
+VACUUM or by a batch-mode table copy. The text itself is read through the
+tasks_fts_source view rather than stored twice. PostgreSQL gets a generated
+tsvector column with a GIN index. Both follow every write path (single, batch and cascading deletes)
+because the database maintains them, not the routes.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.models.task import Task
+
+SQLITE_FTS_TABLE = "tasks_fts"
+SQLITE_FTS_KEYS_TABLE = "tasks_fts_keys"
+
+SQLITE_SEARCH_DDL = [
+    "CREATE TABLE IF NOT EXISTS tasks_fts_keys ("
+    "id INTEGER PRIMARY KEY, task_id VARCHAR(36) NOT NULL UNIQUE)",
+    "CREATE VIEW IF NOT EXISTS tasks_fts_source AS "
+    "SELECT k.id AS id, t.title AS title, t.description AS description "
+    "FROM tasks_fts_keys AS k JOIN tasks AS t ON t.id = k.task_id",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, description, "
+    "content='tasks_fts_source', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts_keys(task_id) VALUES (new.id); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (last_insert_rowid(), new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "SELECT 'delete', id, old.title, old.description FROM tasks_fts_keys "
+    "WHERE task_id = old.id; "
+    "DELETE FROM tasks_fts_keys WHERE task_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "SELECT 'delete', id, old.title, old.description FROM tasks_fts_keys "
+    "WHERE task_id = old.id; "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "SELECT id, new.title, new.description FROM tasks_fts_keys WHERE task_id = new.id; END",
+]
+
+# Drops the index, including the earlier one keyed on tasks.rowid
+SQLITE_SEARCH_DROP = [
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TABLE IF EXISTS tasks_fts",
+    "DROP VIEW IF EXISTS tasks_fts_source",
+    "DROP TABLE IF EXISTS tasks_fts_keys",
+]
+
+# Re-index every task, e.g. after the index was added to an existing database
+SQLITE_SEARCH_REBUILD = [
+    "INSERT INTO tasks_fts_keys(task_id) SELECT id FROM tasks "
+    "WHERE id NOT IN (SELECT task_id FROM tasks_fts_keys)",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_SEARCH_DDL = [
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('english', "
+    "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+]
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_SEARCH_DROP:
+    event.listen(Task.__table__, "after_drop", DDL(_statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,26 @@
+"""
+TaskTombstone database model.
+"""
+
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from datetime import datetime
+
+from app.database import Base
+
+
+class TaskTombstone(Base):
+    """Record of a deleted task, so change feeds can report the deletion."""
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        # Change feed scan: deletions in a list after a revision
+        Index("ix_task_tombstones_list_id_revision_task_id", "list_id", "revision", "task_id"),
+    )
+
+    task_id = Column(String(36), primary_key=True)
+    list_id = Column(String(36), ForeignKey("lists.id", ondelete="CASCADE"), nullable=False)
+    revision = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<TaskTombstone(task_id={self.task_id}, revision={self.revision})>"
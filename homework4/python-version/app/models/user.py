@@ -23,7 +23,9 @@ class User(Base):
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
 
     # Relationships
-    lists = relationship("TodoList", back_populates="owner", cascade="all, delete-orphan")
+    lists = relationship(
+        "TodoList", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
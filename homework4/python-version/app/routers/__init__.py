@@ -1,7 +1,11 @@
 """
 API route handlers.
+
+Each router carries the API prefix itself rather than getting it from
+include_router, so a request's scope["route"].path is the full route
+template (FastAPI includes routers lazily).
 """
 
-from app.routers import auth, users, lists, tasks
+from app.routers import auth, users, lists, tasks, events
 
-__all__ = ["auth", "users", "lists", "tasks"]
+__all__ = ["auth", "users", "lists", "tasks", "events"]
@@ -4,22 +4,28 @@ Authentication routes for signup, login, and logout.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, TokenResponse, UserResponse
 from app.services.jwt import create_access_token, get_token_expiry
 from app.services.auth import authenticate_user, get_current_user, blacklist_token
+from app.services.hashing import password_executor
+from app.services.user_cache import Principal
 from app.utils.security import hash_password
 
-router = APIRouter()
+settings = get_settings()
+
+router = APIRouter(prefix=settings.API_V1_PREFIX)
 security = HTTPBearer()
 
 
 @router.post("/auth/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new user account and return a JWT token.
 
@@ -30,7 +36,8 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     Returns user object and JWT token.
     """
     # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
+    result = await db.execute(select(User).where(User.username == user_data.username))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -39,7 +46,8 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_email = result.scalar_one_or_none()
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -47,8 +55,8 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
             headers={"X-Error-Code": "CONFLICT"}
         )
 
-    # Hash password
-    hashed_password = hash_password(user_data.password)
+    # Hash password on the bounded password pool
+    hashed_password = await password_executor.run(hash_password, user_data.password)
 
     # Create new user
     new_user = User(
@@ -59,10 +67,9 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
     try:
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User with this username or email already exists",
@@ -79,7 +86,7 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/auth/login", response_model=TokenResponse)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     Authenticate user and return JWT token.
 
@@ -89,7 +96,7 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     Returns user object and JWT token.
     """
     # Authenticate user
-    user = authenticate_user(db, credentials.username, credentials.password)
+    user = await authenticate_user(db, credentials.username, credentials.password)
 
     # Create access token
     access_token = create_access_token(data={"sub": user.id})
@@ -101,10 +108,10 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT)
-def logout(
+async def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Logout user and blacklist the current JWT token.
@@ -125,6 +132,6 @@ def logout(
         )
 
     # Blacklist the token
-    blacklist_token(db, token, current_user.id, expires_at)
+    await blacklist_token(db, token, current_user.id, expires_at)
 
     return None
@@ -0,0 +1,129 @@
+"""
+Routes streaming a list's task events to subscribers.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
+import orjson
+
+from app.config import get_settings
+from app.database import get_db
+from app.models.list import TodoList
+from app.services.events import EVICTED, Event, Subscription, event_hub
+from app.utils.validators import validate_uuid
+
+settings = get_settings()
+
+router = APIRouter(prefix=settings.API_V1_PREFIX)
+
+
+async def _subscribe(db: AsyncSession, list_id: str) -> Subscription:
+    """
+    Subscribe to an existing list's events.
+
+    Reads from the primary: clients typically subscribe right after
+    creating a list, before a replica may have it. Releases the session's
+    connection before returning, so long-lived streams do not hold on to
+    the connection pool.
+
+    Raises:
+        HTTPException: 400 if the ID is invalid, 404 if the list does not exist
+    """
+    validate_uuid(list_id, "List ID")
+    exists = await db.scalar(select(TodoList.id).where(TodoList.id == list_id))
+    await db.close()
+    if exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="List not found",
+            headers={"X-Error-Code": "NOT_FOUND"},
+        )
+    return event_hub.subscribe(list_id)
+
+
+def _sse(event: Event) -> bytes:
+    """Format an event as a server-sent event, using the revision as its ID."""
+    lines = [b"event: " + event["type"].encode()]
+    if "revision" in event:
+        lines.append(b"id: %d" % event["revision"])
+    lines.append(b"data: " + orjson.dumps(event))
+    return b"\n".join(lines) + b"\n\n"
+
+
+@router.get("/lists/{list_id}/events")
+async def stream_list_events(list_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Stream a list's task changes as server-sent events.
+
+    - **list_id**: UUID v4 of the list
+
+    Sends `task.created`, `task.updated` and `task.deleted` events as tasks
+    change, `tasks.changed` after a batch and `list.deleted` before closing
+    when the list is deleted. Each event's ID is the list revision it
+    produced. A client that falls too far behind receives `evicted` and is
+    disconnected; after any gap, resync with
+    `GET /lists/{list_id}/changes?since=<last event ID>`.
+    """
+    subscription = await _subscribe(db, list_id)
+
+    async def stream():
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                event = await subscription.get(timeout=settings.EVENT_HEARTBEAT_INTERVAL)
+                if event is None:
+                    if await request.is_disconnected():
+                        return
+                    yield b": keepalive\n\n"
+                    continue
+                yield _sse(event)
+                if event is EVICTED or event["type"] == "list.deleted":
+                    return
+        finally:
+            event_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/lists/{list_id}/ws")
+async def list_events_websocket(
+    websocket: WebSocket, list_id: str, db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream a list's task changes over a WebSocket.
+
+    Sends the same events as `GET /lists/{list_id}/events`, one JSON text
+    message each, plus `{"type": "keepalive"}` on idle connections. Closes
+    with 1008 if the list does not exist, 1000 after `list.deleted` and 1013
+    after `evicted`.
+    """
+    try:
+        subscription = await _subscribe(db, list_id)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    try:
+        await websocket.accept()
+        while True:
+            event = await subscription.get(timeout=settings.EVENT_HEARTBEAT_INTERVAL)
+            if event is None:
+                event = {"type": "keepalive"}
+            await websocket.send_text(orjson.dumps(event).decode())
+            if event is EVICTED:
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                return
+            if event["type"] == "list.deleted":
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        pass
+    finally:
+        event_hub.unsubscribe(subscription)
@@ -2,55 +2,91 @@
 List routes for CRUD operations on todo lists.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+
+from app.config import get_settings
+from app.database import get_db, get_read_db
 from app.models.list import TodoList
 from app.schemas.list import ListCreate, ListUpdate, ListResponse
+from app.services.events import event_hub
+from app.utils.conditional import check_if_match, not_modified, resource_etag, validator_headers
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate
+from app.utils.responses import json_response
 from app.utils.validators import validate_uuid
 
-router = APIRouter()
+settings = get_settings()
+
+router = APIRouter(prefix=settings.API_V1_PREFIX)
+
+
+def _list_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="List not found",
+        headers={"X-Error-Code": "NOT_FOUND"},
+    )
 
 
 @router.get("/lists", response_model=List[ListResponse])
-def get_all_lists(db: Session = Depends(get_db)):
+async def get_all_lists(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Retrieve all lists.
+    Retrieve lists, one page at a time.
+
+    - **limit**: Optional, maximum number of lists to return
+    - **cursor**: Optional, opaque cursor from a previous page's X-Next-Cursor header
 
-    Returns array of all todo lists in the system.
+    Returns array of todo lists ordered by creation time. When more lists
+    remain, the X-Next-Cursor response header holds the cursor for the next page.
     """
-    lists = db.query(TodoList).all()
-    return [ListResponse.from_orm(lst) for lst in lists]
+    lists, next_cursor = await paginate(db, select(TodoList), TodoList, limit, cursor)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return json_response([ListResponse.serialize(lst) for lst in lists], headers=headers)
 
 
 @router.get("/lists/{list_id}", response_model=ListResponse)
-def get_list(list_id: str, db: Session = Depends(get_db)):
+async def get_list(
+    list_id: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
     Retrieve a single list by ID.
 
     - **list_id**: UUID v4 of the list
 
-    Returns the list object if found.
+    Returns the list object if found, with ETag and Last-Modified headers.
+    Returns 304 Not Modified if If-None-Match / If-Modified-Since match.
     """
     # Validate UUID
     validate_uuid(list_id, "List ID")
 
     # Get list from database
-    lst = db.query(TodoList).filter(TodoList.id == list_id).first()
+    lst = await db.get(TodoList, list_id)
     if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
-        )
+        raise _list_not_found()
 
-    return ListResponse.from_orm(lst)
+    etag = resource_etag(lst.id, lst.created_at, lst.updated_at)
+    last_modified = lst.updated_at or lst.created_at
+    cached = not_modified(etag, last_modified, if_none_match, if_modified_since)
+    if cached is not None:
+        return cached
+
+    return json_response(
+        ListResponse.serialize(lst), headers=validator_headers(etag, last_modified)
+    )
 
 
 @router.post("/lists", response_model=ListResponse, status_code=status.HTTP_201_CREATED)
-def create_list(list_data: ListCreate, db: Session = Depends(get_db)):
+async def create_list(list_data: ListCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new list.
 
@@ -63,23 +99,29 @@ def create_list(list_data: ListCreate, db: Session = Depends(get_db)):
     new_list = TodoList(name=list_data.title, description=list_data.description)
 
     db.add(new_list)
-    db.commit()
-    db.refresh(new_list)
+    await db.commit()
 
-    return ListResponse.from_orm(new_list)
+    return json_response(ListResponse.serialize(new_list), status_code=status.HTTP_201_CREATED)
 
 
 @router.patch("/lists/{list_id}", response_model=ListResponse)
-def update_list(list_id: str, list_data: ListUpdate, db: Session = Depends(get_db)):
+async def update_list(
+    list_id: str,
+    list_data: ListUpdate,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Update an existing list.
 
     - **list_id**: UUID v4 of the list
     - **title**: Optional, 1-255 characters if provided
     - **description**: Optional, max 1000 characters if provided
+    - **If-Match** header: Optional, ETag from a previous read; the update is
+      rejected with 412 if the list has changed since
 
     At least one field must be provided for update.
-    Returns the updated list object.
+    Returns the updated list object with its new ETag.
     """
     # Validate UUID
     validate_uuid(list_id, "List ID")
@@ -92,29 +134,47 @@ def update_list(list_id: str, list_data: ListUpdate, db: Session = Depends(get_d
             headers={"X-Error-Code": "VALIDATION_ERROR"},
         )
 
-    # Get list from database
-    lst = db.query(TodoList).filter(TodoList.id == list_id).first()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
+    stmt = update(TodoList).where(TodoList.id == list_id)
+    if if_match is not None:
+        result = await db.execute(
+            select(TodoList.created_at, TodoList.updated_at).where(TodoList.id == list_id)
+        )
+        current = result.one_or_none()
+        if current is None:
+            raise _list_not_found()
+        check_if_match(resource_etag(list_id, current.created_at, current.updated_at), if_match)
+        # Compare-and-set, so a concurrent update between the check and the write still fails
+        stmt = stmt.where(
+            TodoList.updated_at.is_(None)
+            if current.updated_at is None
+            else TodoList.updated_at == current.updated_at
         )
 
     # Update fields
+    now = datetime.utcnow()
+    values = {"updated_at": now, "revision": TodoList.revision + 1, "changed_at": now}
     if list_data.title is not None:
-        lst.name = list_data.title
+        values["name"] = list_data.title
     if list_data.description is not None:
-        lst.description = list_data.description
+        values["description"] = list_data.description
+
+    # Update and read back the row in one statement
+    result = await db.execute(stmt.values(**values).returning(TodoList))
+    lst = result.scalar_one_or_none()
+    if not lst:
+        check_if_match(None, if_match)
+        raise _list_not_found()
 
-    db.commit()
-    db.refresh(lst)
+    await db.commit()
 
-    return ListResponse.from_orm(lst)
+    return json_response(
+        ListResponse.serialize(lst),
+        headers=validator_headers(resource_etag(lst.id, lst.created_at, lst.updated_at), now),
+    )
 
 
 @router.delete("/lists/{list_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_list(list_id: str, db: Session = Depends(get_db)):
+async def delete_list(list_id: str, db: AsyncSession = Depends(get_db)):
     """
     Delete a list and all associated tasks.
 
@@ -126,17 +186,12 @@ def delete_list(list_id: str, db: Session = Depends(get_db)):
     # Validate UUID
     validate_uuid(list_id, "List ID")
 
-    # Get list from database
-    lst = db.query(TodoList).filter(TodoList.id == list_id).first()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
-        )
+    # Delete list in one statement; the database cascades to its tasks
+    result = await db.execute(delete(TodoList).where(TodoList.id == list_id))
+    if result.rowcount == 0:
+        raise _list_not_found()
 
-    # Delete list (cascade will delete tasks)
-    db.delete(lst)
-    db.commit()
+    await db.commit()
 
+    await event_hub.publish(list_id, {"type": "list.deleted", "listId": list_id})
     return None
@@ -2,74 +2,506 @@
 Task routes for CRUD operations on tasks.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-import json
-
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from sqlalchemy import delete, insert, literal, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import uuid
+
+from app.config import get_settings
+from app.database import get_db, get_read_db
 from app.models.list import TodoList
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.models.task import Task, PriorityEnum as TaskPriority
+from app.models.task_category import TaskCategory
+from app.models.task_tombstone import TaskTombstone
+from app.schemas.task import (
+    PriorityEnum,
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskChangesResponse,
+    TASK_FIELD_READERS,
+)
+from app.services.events import event_hub
+from app.services.search import full_text_search
+from app.utils.conditional import (
+    check_if_match,
+    make_etag,
+    not_modified,
+    resource_etag,
+    validator_headers,
+)
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    invalid_cursor,
+    paginate,
+)
+from app.utils.responses import json_response
 from app.utils.validators import validate_uuid
 
-router = APIRouter()
+settings = get_settings()
+
+router = APIRouter(prefix=settings.API_V1_PREFIX)
+
+# Orderings accepted by ?sort= on task listings; prefix with "-" to reverse
+TASK_SORT_KEYS = {
+    "createdAt": SortKey("createdAt", Task.created_at),
+    "dueDate": SortKey("dueDate", Task.due_date, nullable=True),
+    "priority": SortKey(
+        "priority",
+        Task.priority,
+        nullable=True,
+        ranks={TaskPriority.LOW: 1, TaskPriority.MEDIUM: 2, TaskPriority.HIGH: 3},
+    ),
+    "title": SortKey("title", Task.title),
+}
+
+# Response field -> column, for loading only what ?fields= asks for
+TASK_FIELD_COLUMNS = {
+    "id": Task.id,
+    "listId": Task.list_id,
+    "title": Task.title,
+    "description": Task.description,
+    "completed": Task.completed,
+    "dueDate": Task.due_date,
+    "priority": Task.priority,
+    "createdAt": Task.created_at,
+    "updatedAt": Task.updated_at,
+}
+
+
+def _new_task_values(list_id: str, task_data: TaskCreate) -> Dict[str, Any]:
+    """Column values for a new task."""
+    return {
+        "list_id": list_id,
+        "title": task_data.title,
+        "description": task_data.description,
+        "completed": task_data.completed,
+        "due_date": task_data.dueDate,
+        "priority": task_data.priority,
+    }
+
+
+def _task_update_values(task_data: TaskUpdate) -> Dict[str, Any]:
+    """Column values for the fields set on an update payload (categories excluded)."""
+    update_data = task_data.dict(exclude_unset=True)
+    values: Dict[str, Any] = {}
+    if task_data.title is not None:
+        values["title"] = task_data.title
+    if task_data.description is not None:
+        values["description"] = task_data.description
+    if task_data.completed is not None:
+        values["completed"] = task_data.completed
+    if "dueDate" in update_data:
+        values["due_date"] = task_data.dueDate
+    if "priority" in update_data:
+        values["priority"] = task_data.priority
+    return values
+
+
+def _batch_result(
+    index: int,
+    op: str,
+    status_code: int,
+    id: Optional[str] = None,
+    task: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """One entry of a TaskBatchResponse, built without model validation."""
+    return {"index": index, "op": op, "status": status_code, "id": id, "task": task, "error": error}
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a ?fields= sparse fieldset.
+
+    Args:
+        fields: Comma-separated response field names, or None for all fields
+
+    Returns:
+        Requested field names in request order, or None for all fields
+
+    Raises:
+        HTTPException: If a field name is unknown or none are given
+    """
+    if fields is None:
+        return None
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in TASK_FIELD_READERS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested",
+            headers={"X-Error-Code": "VALIDATION_ERROR"},
+        )
+    return requested
+
+
+def _list_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="List not found",
+        headers={"X-Error-Code": "NOT_FOUND"},
+    )
+
+
+def _task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Task not found",
+        headers={"X-Error-Code": "NOT_FOUND"},
+    )
+
+
+def _resync_required() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_410_GONE,
+        detail="Changes since this revision are no longer available; sync again without since",
+        headers={"X-Error-Code": "RESYNC_REQUIRED"},
+    )
+
+
+def _task_etag(task: Task) -> str:
+    """ETag of a single task."""
+    return resource_etag(task.id, task.created_at, task.updated_at)
+
+
+def _bump_revision(list_id: Any, now: datetime):
+    """UPDATE statement bumping a list's revision and returning the new value."""
+    return (
+        update(TodoList)
+        .where(TodoList.id == list_id)
+        .values(revision=TodoList.revision + 1, changed_at=now)
+        .returning(TodoList.id, TodoList.revision)
+    )
+
+
+async def _touch_list(db: AsyncSession, list_id: str, now: datetime) -> int:
+    """
+    Record a change to a list's tasks by bumping the list's revision.
+
+    Doubles as the existence check for writes: one UPDATE instead of a probe.
+    The UPDATE also locks the list row, so concurrent writes to one list
+    commit in revision order and the change feed never skips a revision.
+
+    Returns:
+        The list's new revision, to stamp on the tasks being written
+
+    Raises:
+        HTTPException: 404 if the list does not exist
+    """
+    row = (await db.execute(_bump_revision(list_id, now))).one_or_none()
+    if row is None:
+        raise _list_not_found()
+    return row.revision
+
+
+async def _prune_tombstones(db: AsyncSession, list_id: str, revision: int):
+    """
+    Drop a list's tombstones older than TOMBSTONE_RETENTION_REVISIONS.
+
+    The change feed answers 410 to clients syncing from before the retained
+    window, so pruned deletions are never silently missed.
+
+    Args:
+        db: Database session
+        list_id: List the tasks were deleted from
+        revision: The list's new revision
+    """
+    horizon = revision - settings.TOMBSTONE_RETENTION_REVISIONS
+    if horizon > 0:
+        await db.execute(
+            delete(TaskTombstone).where(
+                TaskTombstone.list_id == list_id, TaskTombstone.revision <= horizon
+            )
+        )
+
+
+async def _touch_task_list(db: AsyncSession, task_id: str, now: datetime) -> Tuple[str, int]:
+    """
+    Like _touch_list, for the list holding a task.
+
+    Returns:
+        Tuple of the task's list ID and the list's new revision
+
+    Raises:
+        HTTPException: 404 if the task does not exist
+    """
+    task_list_id = select(Task.list_id).where(Task.id == task_id).scalar_subquery()
+    row = (await db.execute(_bump_revision(task_list_id, now))).one_or_none()
+    if row is None:
+        raise _task_not_found()
+    return row.id, row.revision
 
 
 @router.get("/lists/{list_id}/tasks", response_model=List[TaskResponse])
-def get_tasks_in_list(list_id: str, db: Session = Depends(get_db)):
+async def get_tasks_in_list(
+    request: Request,
+    list_id: str,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    category: Optional[str] = Query(None, max_length=50),
+    completed: Optional[bool] = None,
+    priority: Optional[PriorityEnum] = None,
+    due_after: Optional[datetime] = Query(None, alias="dueAfter"),
+    due_before: Optional[datetime] = Query(None, alias="dueBefore"),
+    sort: str = Query("createdAt", pattern=rf"^-?({'|'.join(TASK_SORT_KEYS)})$"),
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Retrieve all tasks in a specific list.
+    Retrieve tasks in a specific list, one page at a time.
 
     - **list_id**: UUID v4 of the list
+    - **limit**: Optional, maximum number of tasks to return
+    - **cursor**: Optional, opaque cursor from a previous page's X-Next-Cursor header
+    - **category**: Optional, only return tasks tagged with this category
+    - **completed**: Optional, only return completed (true) or open (false) tasks
+    - **priority**: Optional, only return tasks with this priority
+    - **dueAfter**: Optional, only return tasks due at or after this ISO 8601 datetime
+    - **dueBefore**: Optional, only return tasks due before this ISO 8601 datetime
+    - **sort**: Optional, one of createdAt (default), dueDate, priority or title;
+      prefix with "-" for descending order. Tasks without a value sort last.
+    - **fields**: Optional, comma-separated response fields to return, e.g. id,title,dueDate
+
+    Returns array of tasks. When more tasks remain, the X-Next-Cursor
+    response header holds the cursor for the next page; a cursor is only
+    valid with the sort it was issued for.
+
+    The ETag covers the list's revision and the query, so any task change
+    in the list invalidates it; If-None-Match / If-Modified-Since get 304.
+    """
+    # Validate UUID
+    validate_uuid(list_id, "List ID")
+    requested_fields = _parse_fields(fields)
+    sort_key = TASK_SORT_KEYS[sort.lstrip("-")]
 
-    Returns array of all tasks in the specified list.
+    # Check if list exists and whether the client's copy is still current
+    result = await db.execute(
+        select(TodoList.revision, TodoList.changed_at, TodoList.created_at).where(
+            TodoList.id == list_id
+        )
+    )
+    lst = result.one_or_none()
+    if lst is None:
+        raise _list_not_found()
+    etag = make_etag(list_id, lst.revision, sorted(request.query_params.multi_items()))
+    last_modified = lst.changed_at or lst.created_at
+    cached = not_modified(etag, last_modified, if_none_match, if_modified_since)
+    if cached is not None:
+        return cached
+
+    # Get one page of matching tasks for this list
+    stmt = select(Task).where(Task.list_id == list_id)
+    if category is not None:
+        stmt = stmt.where(
+            Task.id.in_(select(TaskCategory.task_id).where(TaskCategory.category == category))
+        )
+    if completed is not None:
+        stmt = stmt.where(Task.completed == completed)
+    if priority is not None:
+        stmt = stmt.where(Task.priority == TaskPriority(priority.value))
+    if due_after is not None:
+        stmt = stmt.where(Task.due_date >= due_after)
+    if due_before is not None:
+        stmt = stmt.where(Task.due_date < due_before)
+
+    if requested_fields is not None:
+        # Load the requested columns plus what the cursor needs
+        columns = [TASK_FIELD_COLUMNS[name] for name in requested_fields if name != "categories"]
+        columns += [Task.id, sort_key.column]
+        stmt = stmt.options(load_only(*{column.key: column for column in columns}.values()))
+        if "categories" not in requested_fields:
+            stmt = stmt.options(noload(Task.category_rows))
+
+    tasks, next_cursor = await paginate(
+        db, stmt, Task, limit, cursor, sort=sort_key, descending=sort.startswith("-")
+    )
+    headers = validator_headers(etag, last_modified)
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return json_response(
+        [TaskResponse.serialize(task, requested_fields) for task in tasks], headers=headers
+    )
+
+
+@router.get("/lists/{list_id}/changes", response_model=TaskChangesResponse)
+async def get_list_changes(
+    list_id: str,
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve the tasks created, updated or deleted in a list since a revision.
+
+    - **list_id**: UUID v4 of the list
+    - **since**: Optional, revision from a previous sync; omit for a full sync
+    - **limit**: Optional, maximum number of changes to return
+    - **cursor**: Optional, opaque cursor from a previous page's X-Next-Cursor header
+
+    Returns the list's current revision, the tasks written since `since`
+    (current state, in revision order) and the IDs of tasks deleted since.
+    When more changes remain, X-Next-Cursor holds the cursor for the next
+    page; once a page has none, store its revision as the next `since`.
+    Deletions are kept for TOMBSTONE_RETENTION_REVISIONS revisions; a
+    `since` or cursor older than that gets 410 RESYNC_REQUIRED, and the
+    client must sync again without `since`.
     """
     # Validate UUID
     validate_uuid(list_id, "List ID")
 
-    # Check if list exists
-    lst = db.query(TodoList).filter(TodoList.id == list_id).first()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
+    # Read the revision first: every change up to it is in this or a later page
+    revision = await db.scalar(select(TodoList.revision).where(TodoList.id == list_id))
+    if revision is None:
+        raise _list_not_found()
+    # Tombstones at or below this revision may have been pruned
+    horizon = revision - settings.TOMBSTONE_RETENTION_REVISIONS
+
+    written = select(
+        Task.id.label("id"), Task.revision.label("revision"), literal(False).label("deleted")
+    ).where(Task.list_id == list_id)
+    deleted = select(TaskTombstone.task_id, TaskTombstone.revision, literal(True)).where(
+        TaskTombstone.list_id == list_id
+    )
+    if cursor:
+        after_revision, after_id = decode_cursor(cursor, "changes")
+        if not isinstance(after_revision, int):
+            raise invalid_cursor()
+        if after_revision <= horizon:
+            raise _resync_required()
+        written = written.where(tuple_(Task.revision, Task.id) > tuple_(after_revision, after_id))
+        deleted = deleted.where(
+            tuple_(TaskTombstone.revision, TaskTombstone.task_id) > tuple_(after_revision, after_id)
         )
+        changes = union_all(written, deleted).subquery()
+    elif since is not None:
+        if since < horizon:
+            raise _resync_required()
+        written = written.where(Task.revision > since)
+        deleted = deleted.where(TaskTombstone.revision > since)
+        changes = union_all(written, deleted).subquery()
+    else:
+        # Full sync: every current task, nothing to delete
+        changes = written.subquery()
+
+    result = await db.execute(
+        select(changes).order_by(changes.c.revision, changes.c.id).limit(limit + 1)
+    )
+    rows = result.all()
+    headers = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers = {NEXT_CURSOR_HEADER: encode_cursor("changes", rows[-1].revision, rows[-1].id)}
+
+    written_ids = [row.id for row in rows if not row.deleted]
+    tasks: List[Task] = []
+    if written_ids:
+        result = await db.execute(
+            select(Task).where(Task.id.in_(written_ids)).order_by(Task.revision, Task.id)
+        )
+        tasks = list(result.scalars())
+
+    return json_response(
+        {
+            "revision": revision,
+            "tasks": [TaskResponse.serialize(task) for task in tasks],
+            "deleted": [row.id for row in rows if row.deleted],
+        },
+        headers=headers,
+    )
 
-    # Get all tasks for this list
-    tasks = db.query(Task).filter(Task.list_id == list_id).all()
-    return [TaskResponse.from_orm(task) for task in tasks]
+
+@router.get("/tasks/search", response_model=List[TaskResponse])
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200),
+    list_id: Optional[str] = Query(None, alias="listId"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Search task titles and descriptions.
+
+    - **q**: Required, words to search for; every word must match, the last
+      one also as a prefix
+    - **listId**: Optional, UUID v4 of a list to restrict the search to
+    - **limit**: Optional, maximum number of tasks to return
+    - **cursor**: Optional, opaque cursor from a previous page's X-Next-Cursor header
+
+    Returns array of tasks, best matches first. When more matches remain,
+    the X-Next-Cursor response header holds the cursor for the next page.
+    Relevance depends on every indexed task, so a task written between two
+    page requests can make later pages skip or repeat matches.
+    """
+    if list_id is not None:
+        validate_uuid(list_id, "List ID")
+
+    tasks, next_cursor = await full_text_search(db, q, limit, cursor, list_id)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return json_response([TaskResponse.serialize(task) for task in tasks], headers=headers)
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-def get_task(task_id: str, db: Session = Depends(get_db)):
+async def get_task(
+    task_id: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
     Retrieve a single task by ID.
 
     - **task_id**: UUID v4 of the task
 
-    Returns the task object if found.
+    Returns the task object if found, with ETag and Last-Modified headers.
+    Returns 304 Not Modified if If-None-Match / If-Modified-Since match.
     """
     # Validate UUID
     validate_uuid(task_id, "Task ID")
 
+    # Conditional polls only need the timestamps, not the task and its categories
+    if if_none_match is not None or if_modified_since is not None:
+        result = await db.execute(
+            select(Task.created_at, Task.updated_at).where(Task.id == task_id)
+        )
+        current = result.one_or_none()
+        if current is None:
+            raise _task_not_found()
+        cached = not_modified(
+            resource_etag(task_id, current.created_at, current.updated_at),
+            current.updated_at or current.created_at,
+            if_none_match,
+            if_modified_since,
+        )
+        if cached is not None:
+            return cached
+
     # Get task from database
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
-        )
+        raise _task_not_found()
 
-    return TaskResponse.from_orm(task)
+    return json_response(
+        TaskResponse.serialize(task),
+        headers=validator_headers(_task_etag(task), task.updated_at or task.created_at),
+    )
 
 
 @router.post(
     "/lists/{list_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED
 )
-def create_task(list_id: str, task_data: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(list_id: str, task_data: TaskCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new task in a specific list.
 
@@ -86,35 +518,36 @@ def create_task(list_id: str, task_data: TaskCreate, db: Session = Depends(get_d
     # Validate UUID
     validate_uuid(list_id, "List ID")
 
-    # Check if list exists
-    lst = db.query(TodoList).filter(TodoList.id == list_id).first()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
-        )
+    # Check if list exists, recording the change on it
+    revision = await _touch_list(db, list_id, datetime.utcnow())
 
     # Create new task
-    new_task = Task(
-        list_id=list_id,
-        title=task_data.title,
-        description=task_data.description,
-        completed=task_data.completed,
-        due_date=task_data.dueDate,
-        priority=task_data.priority,
-        categories=json.dumps(task_data.categories) if task_data.categories else None,
-    )
+    new_task = Task(**_new_task_values(list_id, task_data), revision=revision)
+    new_task.categories_list = task_data.categories
 
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
-
-    return TaskResponse.from_orm(new_task)
+    await db.commit()
+
+    body = TaskResponse.serialize(new_task)
+    await event_hub.publish(
+        list_id,
+        {
+            "type": "task.created",
+            "listId": list_id,
+            "revision": revision,
+            "task": body,
+        },
+    )
+    return json_response(body, status_code=status.HTTP_201_CREATED)
 
 
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
-def update_task(task_id: str, task_data: TaskUpdate, db: Session = Depends(get_db)):
+async def update_task(
+    task_id: str,
+    task_data: TaskUpdate,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Update an existing task.
 
@@ -125,9 +558,11 @@ def update_task(task_id: str, task_data: TaskUpdate, db: Session = Depends(get_d
     - **dueDate**: Optional, ISO 8601 datetime or null
     - **priority**: Optional, enum ('low', 'medium', 'high') or null
     - **categories**: Optional, array of strings, max 10 items
+    - **If-Match** header: Optional, ETag from a previous read; the update is
+      rejected with 412 if the task has changed since
 
     At least one field must be provided for update.
-    Returns the updated task object.
+    Returns the updated task object with its new ETag.
     """
     # Validate UUID
     validate_uuid(task_id, "Task ID")
@@ -141,37 +576,52 @@ def update_task(task_id: str, task_data: TaskUpdate, db: Session = Depends(get_d
             headers={"X-Error-Code": "VALIDATION_ERROR"},
         )
 
-    # Get task from database
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
+    stmt = update(Task).where(Task.id == task_id)
+    if if_match is not None:
+        result = await db.execute(
+            select(Task.created_at, Task.updated_at).where(Task.id == task_id)
+        )
+        current = result.one_or_none()
+        if current is None:
+            raise _task_not_found()
+        check_if_match(resource_etag(task_id, current.created_at, current.updated_at), if_match)
+        # Compare-and-set, so a concurrent update between the check and the write still fails
+        stmt = stmt.where(
+            Task.updated_at.is_(None)
+            if current.updated_at is None
+            else Task.updated_at == current.updated_at
         )
 
-    # Update fields
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.completed is not None:
-        task.completed = task_data.completed
-    if "dueDate" in update_data:
-        task.due_date = task_data.dueDate
-    if "priority" in update_data:
-        task.priority = task_data.priority
+    # Record the change on the task's list, then update and read back the row
+    now = datetime.utcnow()
+    list_id, revision = await _touch_task_list(db, task_id, now)
+    values = _task_update_values(task_data)
+    values.update(updated_at=now, revision=revision)
+    result = await db.execute(stmt.values(**values).returning(Task))
+    task = result.scalar_one_or_none()
+    if not task:
+        check_if_match(None, if_match)
+        raise _task_not_found()
     if "categories" in update_data:
-        task.categories = json.dumps(task_data.categories) if task_data.categories else None
-
-    db.commit()
-    db.refresh(task)
-
-    return TaskResponse.from_orm(task)
+        task.categories_list = task_data.categories
+
+    await db.commit()
+
+    body = TaskResponse.serialize(task)
+    await event_hub.publish(
+        list_id,
+        {
+            "type": "task.updated",
+            "listId": list_id,
+            "revision": revision,
+            "task": body,
+        },
+    )
+    return json_response(body, headers=validator_headers(_task_etag(task), task.updated_at))
 
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(task_id: str, db: Session = Depends(get_db)):
+async def delete_task(task_id: str, db: AsyncSession = Depends(get_db)):
     """
     Delete a task.
 
@@ -182,17 +632,200 @@ def delete_task(task_id: str, db: Session = Depends(get_db)):
     # Validate UUID
     validate_uuid(task_id, "Task ID")
 
-    # Get task from database
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-            headers={"X-Error-Code": "NOT_FOUND"},
+    # Record the change on the task's list, then delete the task leaving a tombstone
+    now = datetime.utcnow()
+    list_id, revision = await _touch_task_list(db, task_id, now)
+    result = await db.execute(delete(Task).where(Task.id == task_id))
+    if result.rowcount == 0:
+        raise _task_not_found()
+    await db.execute(
+        insert(TaskTombstone).values(
+            task_id=task_id, list_id=list_id, revision=revision, deleted_at=now
         )
+    )
+    await _prune_tombstones(db, list_id, revision)
+
+    await db.commit()
+
+    await event_hub.publish(
+        list_id,
+        {
+            "type": "task.deleted",
+            "listId": list_id,
+            "revision": revision,
+            "taskId": task_id,
+        },
+    )
+    return None
 
-    # Delete task
-    db.delete(task)
-    db.commit()
 
-    return None
+@router.post("/lists/{list_id}/tasks/batch", response_model=TaskBatchResponse)
+async def batch_tasks(list_id: str, batch: TaskBatchRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Apply a batch of task operations to a list in a single transaction.
+
+    - **list_id**: UUID v4 of the list
+    - **operations**: Array of up to BATCH_MAX_OPERATIONS items, each one of
+      `{"op": "create", "data": {...}}`, `{"op": "update", "id": "...", "data": {...}}`
+      or `{"op": "delete", "id": "..."}`; `data` follows the single-task create/update rules
+
+    Creates are sent as one multi-row INSERT, deletes as one DELETE, and all
+    changes are committed together. Returns one result per operation, in
+    request order, with its own status code (201, 200, 204, 400 or 404).
+    A batch in which every operation fails changes nothing, not even the
+    list's revision.
+    """
+    # Validate UUID
+    validate_uuid(list_id, "List ID")
+
+    # Check if list exists, recording the change on it
+    now = datetime.utcnow()
+    revision = await _touch_list(db, list_id, now)
+
+    # Load every task targeted by an update or delete with one query
+    target_ids = set()
+    for operation in batch.operations:
+        if operation.op != "create":
+            try:
+                target_ids.add(validate_uuid(operation.id, "Task ID"))
+            except HTTPException:
+                pass
+    existing: Dict[str, Task] = {}
+    if target_ids:
+        result = await db.execute(
+            select(Task).where(Task.list_id == list_id, Task.id.in_(target_ids))
+        )
+        existing = {task.id: task for task in result.scalars()}
+
+    results: List[Dict[str, Any]] = []
+    new_rows: List[Dict[str, Any]] = []
+    category_rows: List[Dict[str, Any]] = []
+    deleted_ids: List[str] = []
+
+    for index, operation in enumerate(batch.operations):
+        if operation.op == "create":
+            row = _new_task_values(list_id, operation.data)
+            # Strictly increasing timestamps keep the (created_at, id) listing
+            # in request order rather than random UUID order
+            created_at = now + timedelta(microseconds=len(new_rows))
+            row.update(
+                id=str(uuid.uuid4()), created_at=created_at, updated_at=None, revision=revision
+            )
+            new_rows.append(row)
+            categories = operation.data.categories or []
+            category_rows.extend(
+                {"task_id": row["id"], "position": position, "category": category}
+                for position, category in enumerate(categories)
+            )
+            new_task = Task(**row)
+            new_task.categories_list = categories
+            results.append(
+                _batch_result(
+                    index=index,
+                    op="create",
+                    status_code=status.HTTP_201_CREATED,
+                    id=row["id"],
+                    task=TaskResponse.serialize(new_task),
+                )
+            )
+            continue
+
+        try:
+            validate_uuid(operation.id, "Task ID")
+        except HTTPException as exc:
+            results.append(
+                _batch_result(
+                    index=index,
+                    op=operation.op,
+                    status_code=exc.status_code,
+                    id=operation.id,
+                    error=exc.detail,
+                )
+            )
+            continue
+
+        task = existing.get(operation.id)
+        if task is None:
+            results.append(
+                _batch_result(
+                    index=index,
+                    op=operation.op,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    id=operation.id,
+                    error="Task not found",
+                )
+            )
+        elif operation.op == "update":
+            if not operation.data.dict(exclude_unset=True):
+                results.append(
+                    _batch_result(
+                        index=index,
+                        op="update",
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        id=task.id,
+                        error="At least one field must be provided for update",
+                    )
+                )
+                continue
+            for column, value in _task_update_values(operation.data).items():
+                setattr(task, column, value)
+            if "categories" in operation.data.dict(exclude_unset=True):
+                task.categories_list = operation.data.categories
+            task.updated_at = now
+            task.revision = revision
+            results.append(
+                _batch_result(
+                    index=index,
+                    op="update",
+                    status_code=status.HTTP_200_OK,
+                    id=task.id,
+                    task=TaskResponse.serialize(task),
+                )
+            )
+        else:
+            # Later operations on a deleted task report 404
+            del existing[task.id]
+            deleted_ids.append(task.id)
+            results.append(
+                _batch_result(
+                    index=index,
+                    op="delete",
+                    status_code=status.HTTP_204_NO_CONTENT,
+                    id=task.id,
+                )
+            )
+
+    if not any(result["status"] < 400 for result in results):
+        # Undo the revision bump so client validators stay valid
+        await db.rollback()
+        return json_response({"results": results})
+
+    if new_rows:
+        # Render NULLs so rows with different optional fields share one INSERT
+        await db.execute(insert(Task).execution_options(render_nulls=True), new_rows)
+    if category_rows:
+        await db.execute(insert(TaskCategory), category_rows)
+    # Write pending updates before deleting, then remove deleted tasks in one statement
+    await db.flush()
+    if deleted_ids:
+        await db.execute(delete(Task).where(Task.id.in_(deleted_ids)))
+        await db.execute(
+            insert(TaskTombstone),
+            [
+                {"task_id": task_id, "list_id": list_id, "revision": revision, "deleted_at": now}
+                for task_id in deleted_ids
+            ],
+        )
+        await _prune_tombstones(db, list_id, revision)
+    await db.commit()
+
+    # One event for the whole batch; subscribers read the details from the change feed
+    await event_hub.publish(
+        list_id,
+        {
+            "type": "tasks.changed",
+            "listId": list_id,
+            "revision": revision,
+        },
+    )
+    return json_response({"results": results})
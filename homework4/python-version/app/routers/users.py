@@ -3,18 +3,19 @@ User routes for profile management.
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models.user import User
+from app.config import get_settings
 from app.schemas.user import UserResponse
 from app.services.auth import get_current_user
+from app.services.user_cache import Principal
 
-router = APIRouter()
+settings = get_settings()
+
+router = APIRouter(prefix=settings.API_V1_PREFIX)
 
 
 @router.get("/users/profile", response_model=UserResponse)
-def get_profile(current_user: User = Depends(get_current_user)):
+async def get_profile(current_user: Principal = Depends(get_current_user)):
     """
     Get current user's profile information.
 
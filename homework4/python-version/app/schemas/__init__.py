@@ -20,6 +20,10 @@ from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskResponse,
+    TaskBatchRequest,
+    TaskBatchResult,
+    TaskBatchResponse,
+    TaskChangesResponse,
     PriorityEnum,
 )
 
@@ -37,5 +41,9 @@ __all__ = [
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
+    "TaskBatchRequest",
+    "TaskBatchResult",
+    "TaskBatchResponse",
+    "TaskChangesResponse",
     "PriorityEnum",
 ]
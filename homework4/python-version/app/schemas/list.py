@@ -84,3 +84,14 @@ class ListResponse(BaseModel):
             createdAt=obj.created_at,
             updatedAt=obj.updated_at,
         )
+
+    @staticmethod
+    def serialize(obj) -> dict:
+        """Build the response dict straight from a trusted ORM object, without validation."""
+        return {
+            "id": obj.id,
+            "title": obj.name,
+            "description": obj.description,
+            "createdAt": obj.created_at,
+            "updatedAt": obj.updated_at,
+        }
@@ -4,9 +4,13 @@ Task schemas for request/response validation.
 
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Literal, Optional, List, Union
 from enum import Enum
 
+from app.config import get_settings
+
+settings = get_settings()
+
 
 class PriorityEnum(str, Enum):
     """Task priority levels."""
@@ -135,3 +139,108 @@ class TaskResponse(BaseModel):
             createdAt=obj.created_at,
             updatedAt=obj.updated_at,
         )
+
+    @staticmethod
+    def serialize(obj, fields: Optional[List[str]] = None) -> dict:
+        """
+        Build the response dict straight from a trusted ORM object, without validation.
+
+        Args:
+            obj: Task ORM object
+            fields: Optional sparse fieldset; only these fields are read and returned
+
+        Returns:
+            Response dict
+        """
+        if fields is not None:
+            return {name: TASK_FIELD_READERS[name](obj) for name in fields}
+        return {
+            "id": obj.id,
+            "listId": obj.list_id,
+            "title": obj.title,
+            "description": obj.description,
+            "completed": obj.completed,
+            "dueDate": obj.due_date,
+            "priority": obj.priority.value if obj.priority else None,
+            "categories": obj.categories_list,
+            "createdAt": obj.created_at,
+            "updatedAt": obj.updated_at,
+        }
+
+
+# Response field -> reader, for sparse fieldsets. Only the requested fields are
+# touched, so unloaded columns are never lazy-loaded.
+TASK_FIELD_READERS = {
+    "id": lambda obj: obj.id,
+    "listId": lambda obj: obj.list_id,
+    "title": lambda obj: obj.title,
+    "description": lambda obj: obj.description,
+    "completed": lambda obj: obj.completed,
+    "dueDate": lambda obj: obj.due_date,
+    "priority": lambda obj: obj.priority.value if obj.priority else None,
+    "categories": lambda obj: obj.categories_list,
+    "createdAt": lambda obj: obj.created_at,
+    "updatedAt": lambda obj: obj.updated_at,
+}
+
+
+class TaskBatchCreate(BaseModel):
+    """Batch operation creating a task."""
+
+    op: Literal["create"]
+    data: TaskCreate
+
+
+class TaskBatchUpdate(BaseModel):
+    """Batch operation updating a task."""
+
+    op: Literal["update"]
+    id: str
+    data: TaskUpdate
+
+
+class TaskBatchDelete(BaseModel):
+    """Batch operation deleting a task."""
+
+    op: Literal["delete"]
+    id: str
+
+
+TaskBatchOperation = Annotated[
+    Union[TaskBatchCreate, TaskBatchUpdate, TaskBatchDelete], Field(discriminator="op")
+]
+
+
+class TaskBatchRequest(BaseModel):
+    """Schema for a batch of task operations applied in one transaction."""
+
+    # Bounded here rather than in the handler so oversized batches are
+    # rejected during validation
+    operations: List[TaskBatchOperation] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_OPERATIONS
+    )
+
+
+class TaskBatchResult(BaseModel):
+    """Outcome of a single batch operation."""
+
+    index: int
+    op: str
+    status: int
+    id: Optional[str] = None
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+
+class TaskBatchResponse(BaseModel):
+    """Schema for batch response, one result per operation in request order."""
+
+    results: List[TaskBatchResult]
+
+
+class TaskChangesResponse(BaseModel):
+    """Schema for a page of a list's change feed."""
+
+    revision: int
+    tasks: List[TaskResponse]
+    deleted: List[str]
@@ -0,0 +1,170 @@
+"""
+Production server: gunicorn managing uvicorn workers.
+
+The app is imported once in the master and shared copy-on-write with the
+workers it forks. The master also creates and migrates the database before
+forking, so workers start serving without racing each other through
+init_db. Each worker drops the connection pools it inherited and opens its
+own connections.
+
+Usage:
+    python -m app.server [--workers 4] [--host 0.0.0.0] [--port 8000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict
+
+from gunicorn.app.base import BaseApplication
+from uvicorn_worker import UvicornWorker
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class Worker(UvicornWorker):
+    """Uvicorn worker on uvloop and httptools; both ship with uvicorn[standard]."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
+
+
+def default_workers() -> int:
+    """One worker per CPU this process may run on, honouring cpusets/affinity."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def prepare_metrics_dir(workers: int):
+    """
+    Switch prometheus-client to multiprocess mode for more than one worker.
+
+    Each worker writes its samples to PROMETHEUS_MULTIPROC_DIR and /metrics
+    aggregates them, whichever worker serves the scrape. The directory is
+    emptied on start so samples of an earlier run are not counted. Must run
+    before prometheus_client is imported.
+
+    Args:
+        workers: Number of worker processes
+    """
+    if workers < 2:
+        return
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+    else:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="todo-metrics-")
+
+
+async def prepare_database():
+    """Create and migrate the database, then close every pooled connection."""
+    from app.database import engine, init_db, replicas
+
+    await init_db()
+    # Nothing may stay connected across fork: workers would share sockets
+    # and SQLite handles, and aiosqlite's connection threads do not survive it
+    await engine.dispose()
+    await replicas.dispose()
+
+
+def on_starting(arbiter):
+    """Master hook: initialize the database once, before any worker forks."""
+    asyncio.run(prepare_database())
+    logger.info("Database initialized")
+
+
+def post_fork(arbiter, worker):
+    """Worker hook: give the worker pools of its own."""
+    from app.database import engine, replicas
+
+    # close=False leaves the parent's connections (if any) alone and only
+    # forgets them in this process
+    engine.sync_engine.dispose(close=False)
+    for replica in replicas.engines:
+        replica.sync_engine.dispose(close=False)
+
+
+def child_exit(arbiter, worker):
+    """Master hook: drop a dead worker's live gauges from the metrics."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+class Server(BaseApplication):
+    """Gunicorn application serving app.main:app with settings from app.config."""
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+def server_options(host: str, port: int, workers: int) -> Dict[str, Any]:
+    """
+    Gunicorn settings for the given bind address and worker count.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+
+    Returns:
+        Settings for Server
+    """
+    settings = get_settings()
+    return {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": Worker,
+        "preload_app": True,
+        "backlog": settings.SERVER_BACKLOG,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "timeout": settings.SERVER_TIMEOUT,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS // 10,
+        "loglevel": settings.LOG_LEVEL,
+        "accesslog": None,  # the app's middleware already logs every request
+        "on_starting": on_starting,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+
+def main():
+    """Command-line entry point."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS or default_workers())
+    args = parser.parse_args()
+
+    if args.workers > 1 and settings.EVENT_BROKER == "local":
+        logger.warning(
+            "EVENT_BROKER=local only delivers task events to subscribers on the same worker; "
+            "configure a shared broker to fan out across %d workers",
+            args.workers,
+        )
+    prepare_metrics_dir(args.workers)
+    Server(server_options(args.host, args.port, args.workers)).run()
+
+
+if __name__ == "__main__":
+    main()
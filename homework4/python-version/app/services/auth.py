@@ -4,20 +4,24 @@ Authentication service for user verification and token validation.
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError
 from datetime import datetime
 
 from app.database import get_db
 from app.models.user import User
 from app.models.token_blacklist import TokenBlacklist
+from app.services.hashing import password_executor
 from app.services.jwt import verify_token
-from app.utils.security import verify_password
+from app.services.revocation import revocation_cache
+from app.services.user_cache import Principal, user_cache
+from app.utils.security import verify_and_update_password
 
 security = HTTPBearer()
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> User:
     """
     Authenticate a user by username and password.
 
@@ -32,7 +36,8 @@ def authenticate_user(db: Session, username: str, password: str) -> User:
     Raises:
         HTTPException: If authentication fails
     """
-    user = db.query(User).filter(User.username == username).first()
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(
@@ -41,38 +46,54 @@ def authenticate_user(db: Session, username: str, password: str) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = await password_executor.run(
+        verify_and_update_password, password, user.password_hash
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Transparently upgrade hashes made with older Argon2 parameters
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+
     return user
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
     """
     Get the current authenticated user from JWT token.
 
+    Revocations come from the in-process cache, synced from the primary.
+    A logout is honoured at once by the worker that handled it; other
+    workers keep accepting the token until their next sync, up to
+    REVOCATION_SYNC_INTERVAL seconds later.
+
+    Principals are usually served from the cache without a query. The
+    session connects on its first statement, so such requests do not check
+    out a connection at all.
+
     Args:
         credentials: HTTP authorization credentials containing JWT token
-        db: Database session
+        db: Database session on the primary
 
     Returns:
-        User object if token is valid
+        Principal snapshot of the user if token is valid
 
     Raises:
         HTTPException: If token is invalid, expired, or blacklisted
     """
     token = credentials.credentials
 
-    # Check if token is blacklisted
-    blacklisted = db.query(TokenBlacklist).filter(TokenBlacklist.token == token).first()
-    if blacklisted:
+    # Check if token is blacklisted (served from the in-process cache)
+    if await revocation_cache.is_revoked(db, token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -96,18 +117,26 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from the principal cache, falling back to the database
+    principal = user_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    # Read the primary: a cache miss is rare, and a user created moments ago
+    # may not have reached a replica yet
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    return user
+    principal = Principal.from_user(user)
+    user_cache.put(principal)
+    return principal
 
 
-def blacklist_token(db: Session, token: str, user_id: str, expires_at: datetime):
+async def blacklist_token(db: AsyncSession, token: str, user_id: str, expires_at: datetime):
     """
     Add a token to the blacklist.
 
@@ -118,7 +147,7 @@ def blacklist_token(db: Session, token: str, user_id: str, expires_at: datetime)
         expires_at: Token expiration time
     """
     # Clean up expired tokens first
-    db.query(TokenBlacklist).filter(TokenBlacklist.expires_at < datetime.utcnow()).delete()
+    await db.execute(delete(TokenBlacklist).where(TokenBlacklist.expires_at < datetime.utcnow()))
 
     # Add token to blacklist
     blacklisted_token = TokenBlacklist(
@@ -127,4 +156,7 @@ def blacklist_token(db: Session, token: str, user_id: str, expires_at: datetime)
         expires_at=expires_at
     )
     db.add(blacklisted_token)
-    db.commit()
+    await db.commit()
+
+    revocation_cache.add(token, expires_at.timestamp())
+    user_cache.invalidate(user_id)
@@ -0,0 +1,223 @@
+"""
+In-process pub/sub hub pushing task changes to subscribers of a list.
+
+Handlers publish an event after committing a change; every subscriber to
+that list gets it on its own bounded queue. A subscriber that falls a full
+queue behind is evicted rather than buffered without limit or allowed to
+slow down publishers; it is told so and resyncs from the change feed.
+
+Events reach each worker's hub through a broker. The default LocalBroker
+only delivers within this process, which is enough for a single worker and
+for tests; with several workers, plug in a broker that relays events between
+them (e.g. over Redis pub/sub or PostgreSQL LISTEN/NOTIFY) via EVENT_BROKER.
+"""
+
+import asyncio
+import importlib
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Set
+
+from app.config import get_settings
+
+settings = get_settings()
+
+Event = Dict[str, Any]
+
+# Final item queued for an evicted subscriber
+EVICTED: Event = {"type": "evicted"}
+
+
+class Subscription:
+    """One subscriber's bounded queue of events for a list."""
+
+    def __init__(self, list_id: str, max_queue: int):
+        self.list_id = list_id
+        self.evicted = False
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=max_queue)
+
+    def offer(self, event: Event) -> bool:
+        """
+        Queue an event without waiting.
+
+        Returns:
+            False if the queue is full
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def evict(self):
+        """Drop queued events and leave only the EVICTED marker."""
+        self.evicted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(EVICTED)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The next event, EVICTED once the subscriber has been evicted,
+            or None if the timeout expired first
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broker(ABC):
+    """
+    Carries published events to the hub of every worker.
+
+    Subclasses relaying between processes send events on publish() and hand
+    each one they receive (including their own) to the deliver callback.
+    Events hold JSON values and datetimes, so encode them with orjson.
+    """
+
+    def attach(self, deliver: Callable[[str, Event], None]):
+        """Register the local hub's fan-out callback."""
+        self._deliver = deliver
+
+    @abstractmethod
+    async def start(self):
+        """Open connections; called on application startup."""
+
+    @abstractmethod
+    async def stop(self):
+        """Close connections; called on application shutdown."""
+
+    @abstractmethod
+    async def publish(self, list_id: str, event: Event):
+        """Send an event to every worker."""
+
+
+class LocalBroker(Broker):
+    """Delivers events to this process's subscribers only."""
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def publish(self, list_id: str, event: Event):
+        self._deliver(list_id, event)
+
+
+class EventHub:
+    """Per-list fan-out of events to bounded subscriber queues."""
+
+    def __init__(self, max_queue: int, broker: Optional[Broker] = None):
+        self.max_queue = max_queue
+        self.broker = broker or LocalBroker()
+        self.broker.attach(self.dispatch)
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+
+    def subscribe(self, list_id: str) -> Subscription:
+        """
+        Start receiving a list's events.
+
+        Args:
+            list_id: ID of the list
+
+        Returns:
+            Subscription to read events from; pass it to unsubscribe() when done
+        """
+        subscription = Subscription(list_id, self.max_queue)
+        self._subscribers[list_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Stop delivering events to a subscription."""
+        subscribers = self._subscribers.get(subscription.list_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.list_id]
+
+    async def publish(self, list_id: str, event: Event):
+        """
+        Publish an event to a list's subscribers in every worker.
+
+        Args:
+            list_id: ID of the list the event belongs to
+            event: Event with at least a "type" key
+        """
+        self.published += 1
+        await self.broker.publish(list_id, event)
+
+    def dispatch(self, list_id: str, event: Event):
+        """
+        Deliver an event to this process's subscribers of a list.
+
+        Never blocks: a subscriber whose queue is full is evicted instead.
+        """
+        for subscription in list(self._subscribers.get(list_id, ())):
+            if subscription.offer(event):
+                self.delivered += 1
+            else:
+                subscription.evict()
+                self.unsubscribe(subscription)
+                self.evicted += 1
+
+    def subscriber_count(self, list_id: Optional[str] = None) -> int:
+        """Number of subscribers to a list, or to all lists."""
+        if list_id is not None:
+            return len(self._subscribers.get(list_id, ()))
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    async def start(self):
+        """Start the broker."""
+        await self.broker.start()
+
+    async def stop(self):
+        """Stop the broker."""
+        await self.broker.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of subscribers and counters."""
+        return {
+            "broker": type(self.broker).__name__,
+            "lists": len(self._subscribers),
+            "subscribers": self.subscriber_count(),
+            "max_queue": self.max_queue,
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
+
+
+def load_broker(path: str) -> Broker:
+    """
+    Instantiate the broker named by EVENT_BROKER.
+
+    Args:
+        path: "local", or "package.module:ClassName" of a Broker subclass
+
+    Returns:
+        Broker instance
+
+    Raises:
+        TypeError: If the class is not a Broker or leaves a method unimplemented
+    """
+    if path == "local":
+        return LocalBroker()
+    module_name, _, class_name = path.partition(":")
+    broker_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(broker_class, type) and issubclass(broker_class, Broker)):
+        raise TypeError(f"EVENT_BROKER {path} is not a Broker subclass")
+    return broker_class()
+
+
+event_hub = EventHub(max_queue=settings.EVENT_QUEUE_SIZE, broker=load_broker(settings.EVENT_BROKER))
@@ -4,9 +4,13 @@ JWT token generation and verification service.
 
 from datetime import datetime, timedelta
 from typing import Dict, Optional
-from jose import JWTError, jwt
+
+# Only the exceptions are imported up front: jose.jwt loads the cryptography
+# backends, so it is imported on the first token operation instead
+from jose import JWTError
 
 from app.config import get_settings
+from app.metrics import JWT_DURATION
 
 settings = get_settings()
 
@@ -32,12 +36,15 @@ def create_access_token(data: Dict[str, str], expires_delta: Optional[timedelta]
 
     to_encode.update({"exp": expire, "iat": datetime.utcnow()})
 
+    from jose import jwt
+
     # Encode token
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET,
-        algorithm=settings.JWT_ALGORITHM
-    )
+    with JWT_DURATION.labels("sign").time():
+        encoded_jwt = jwt.encode(
+            to_encode,
+            settings.JWT_SECRET,
+            algorithm=settings.JWT_ALGORITHM
+        )
 
     return encoded_jwt
 
@@ -55,12 +62,15 @@ def verify_token(token: str) -> Dict[str, any]:
     Raises:
         JWTError: If token is invalid or expired
     """
+    from jose import jwt
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        with JWT_DURATION.labels("verify").time():
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[settings.JWT_ALGORITHM]
+            )
         return payload
     except JWTError as e:
         raise JWTError(f"Invalid token: {str(e)}")
@@ -79,6 +89,8 @@ def get_token_expiry(token: str) -> datetime:
     Raises:
         JWTError: If token is invalid
     """
+    from jose import jwt
+
     try:
         payload = jwt.decode(
             token,
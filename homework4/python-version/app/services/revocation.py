@@ -0,0 +1,239 @@
+"""
+In-process cache of revoked JWT tokens.
+
+Sits in front of the TokenBlacklist table so that authenticated requests
+carrying a live token do not need a database round-trip. Revocations made by
+other workers are picked up by a periodic incremental sync.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.token_blacklist import TokenBlacklist
+
+settings = get_settings()
+
+# Rebuild the Bloom filter once this share of its keys are expired or evicted
+BLOOM_STALE_RATIO = 0.5
+
+
+def token_key(token: str) -> bytes:
+    """
+    Derive the cache key for a token.
+
+    Args:
+        token: Encoded JWT token
+
+    Returns:
+        SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over SHA-256 token digests."""
+
+    def __init__(self, size_bits: int, hash_count: int):
+        if not 1 <= hash_count <= 8:
+            raise ValueError("hash_count must be between 1 and 8")
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, key: bytes):
+        # Digests are uniformly distributed, so slice them instead of rehashing
+        for i in range(self.hash_count):
+            yield int.from_bytes(key[i * 4 : i * 4 + 4], "big") % self.size_bits
+
+    def add(self, key: bytes):
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[bytes]):
+        """Add every key to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def might_contain(self, key: bytes) -> bool:
+        """Return False only if the key was definitely never added."""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RevocationCache:
+    """
+    TTL-bounded set of revoked token digests with a Bloom filter fast path.
+
+    Entries are kept until the token's own expiry, after which the token is
+    rejected by signature verification anyway. When the cache is full the
+    soonest-expiring entries are dropped from the exact set but stay in the
+    Bloom filter, so lookups for them fall back to the database.
+
+    Syncs only add new revocations to the filter. It is rebuilt, on the
+    default executor, once expired and evicted keys make up
+    BLOOM_STALE_RATIO of it.
+    """
+
+    def __init__(self, max_size: int, sync_interval: float, bloom_bits: int, bloom_hashes: int):
+        self.max_size = max_size
+        self.sync_interval = sync_interval
+        self._bloom_bits = bloom_bits
+        self._bloom_hashes = bloom_hashes
+        self.reset()
+
+    def reset(self):
+        """Drop all cached state; the next lookup performs a full sync."""
+        self._revoked: Dict[bytes, float] = {}
+        self._expiries: List[Tuple[float, bytes]] = []  # heap of (expires_at, key)
+        self._bloom = BloomFilter(self._bloom_bits, self._bloom_hashes)
+        self._bloom_keys = 0
+        self._stale_keys = 0
+        self._rebuilding: Optional[List[bytes]] = None  # keys added during a rebuild
+        self._evicted_until = 0.0
+        self._synced_at: Optional[datetime] = None
+        self._next_sync = 0.0
+
+    def add(self, token: str, expires_at: float):
+        """
+        Record a revoked token.
+
+        Args:
+            token: Encoded JWT token
+            expires_at: Token expiry as a Unix timestamp
+        """
+        self._add_key(token_key(token), expires_at)
+
+    def _add_key(self, key: bytes, expires_at: float):
+        if expires_at <= time.time():
+            return
+        if key not in self._revoked:
+            self._bloom.add(key)
+            self._bloom_keys += 1
+            heapq.heappush(self._expiries, (expires_at, key))
+            if self._rebuilding is not None:
+                self._rebuilding.append(key)
+        self._revoked[key] = expires_at
+        if len(self._revoked) > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        self._expire()
+        # Evict in batches so a full cache does not re-sort on every add
+        overflow = len(self._revoked) - self.max_size + self.max_size // 10
+        if len(self._revoked) > self.max_size:
+            for key, exp in sorted(self._revoked.items(), key=lambda item: item[1])[:overflow]:
+                del self._revoked[key]
+                self._stale_keys += 1
+                self._evicted_until = max(self._evicted_until, exp)
+
+    def _expire(self):
+        """Drop expired entries from the exact set."""
+        now = time.time()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiries)
+            # Evicted keys are already gone, and already counted as stale
+            if self._revoked.get(key) == expires_at:
+                del self._revoked[key]
+                self._stale_keys += 1
+
+    async def _rebuild_bloom(self):
+        """Rebuild the filter from live entries once enough of it is stale."""
+        if self._rebuilding is not None:
+            return
+        if not self._stale_keys or self._stale_keys < self._bloom_keys * BLOOM_STALE_RATIO:
+            return
+        # Only safe once every evicted entry has expired, otherwise the
+        # filter would start answering "not revoked" for a live revocation
+        if time.time() < self._evicted_until:
+            return
+
+        current = self._bloom
+        keys = list(self._revoked)
+        bloom = BloomFilter(self._bloom_bits, self._bloom_hashes)
+        added = self._rebuilding = []
+        try:
+            # Hashing up to max_size keys in Python would stall the event loop
+            await asyncio.get_running_loop().run_in_executor(None, bloom.update, keys)
+            if self._bloom is not current:
+                return  # reset() while rebuilding
+            # Revocations that arrived during the rebuild went to the old filter
+            bloom.update(added)
+            self._bloom = bloom
+            self._bloom_keys = len(keys) + len(added)
+            self._stale_keys = max(0, self._bloom_keys - len(self._revoked))
+        finally:
+            if self._rebuilding is added:
+                self._rebuilding = None
+
+    async def sync(self, db: AsyncSession):
+        """
+        Pull revocations recorded since the last sync.
+
+        The first sync loads every unexpired row; later syncs only read rows
+        blacklisted since the previous one, with a small overlap to tolerate
+        clock skew between workers, and add them to the Bloom filter.
+
+        Args:
+            db: Database session
+        """
+        now = datetime.utcnow()
+        self._next_sync = time.monotonic() + self.sync_interval
+        stmt = select(TokenBlacklist.token, TokenBlacklist.expires_at)
+        if self._synced_at is None:
+            stmt = stmt.where(TokenBlacklist.expires_at > now)
+        else:
+            since = self._synced_at - timedelta(seconds=self.sync_interval)
+            stmt = stmt.where(TokenBlacklist.blacklisted_at >= since)
+
+        result = await db.execute(stmt)
+        for token, expires_at in result:
+            self.add(token, expires_at.timestamp())
+        self._synced_at = now
+        self._expire()
+        await self._rebuild_bloom()
+
+    async def is_revoked(self, db: AsyncSession, token: str) -> bool:
+        """
+        Check whether a token has been revoked.
+
+        Args:
+            db: Database session, used for periodic sync and Bloom false positives
+            token: Encoded JWT token
+
+        Returns:
+            True if the token is on the blacklist
+        """
+        if time.monotonic() >= self._next_sync:
+            await self.sync(db)
+
+        key = token_key(token)
+        if not self._bloom.might_contain(key):
+            return False
+        if key in self._revoked:
+            return True
+
+        # Bloom filter false positive or evicted entry: ask the database
+        result = await db.execute(
+            select(TokenBlacklist.expires_at).where(TokenBlacklist.token == token)
+        )
+        expires_at = result.scalar_one_or_none()
+        if expires_at is None:
+            return False
+        self._add_key(key, expires_at.timestamp())
+        return True
+
+
+revocation_cache = RevocationCache(
+    max_size=settings.REVOCATION_CACHE_MAX_SIZE,
+    sync_interval=settings.REVOCATION_SYNC_INTERVAL,
+    bloom_bits=settings.REVOCATION_BLOOM_BITS,
+    bloom_hashes=settings.REVOCATION_BLOOM_HASHES,
+)
@@ -0,0 +1,135 @@
+"""
+Ranked full-text search over task titles and descriptions.
+
+Uses the FTS5 index on SQLite and the tsvector column on PostgreSQL (see
+app.models.task_search). Results are ordered by relevance and paginated with
+a (score, id) keyset cursor.
+
+Scores depend on statistics of the whole index (bm25 on SQLite, document
+lengths for ts_rank_cd on PostgreSQL), so any task write can change the
+score of a match that did not itself change. Pages are therefore only
+consistent with each other while the index does not change: a write between
+two requests can make later pages skip or repeat matches.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import column, func, literal_column, select, table, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.utils.pagination import decode_cursor, encode_cursor, invalid_cursor
+
+SEARCH_SORT = "rank"
+MAX_TERMS = 16
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Split a user query into search terms.
+
+    Only word characters are kept, so user input can never inject FTS5 or
+    tsquery operators.
+
+    Args:
+        query: Raw query string
+
+    Returns:
+        Lower-cased terms, at most MAX_TERMS
+
+    Raises:
+        HTTPException: If the query contains no words
+    """
+    terms = _WORD.findall(query.lower())[:MAX_TERMS]
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain at least one word",
+            headers={"X-Error-Code": "VALIDATION_ERROR"},
+        )
+    return terms
+
+
+def _match_sqlite(terms: List[str]):
+    # Every term must match; the last one as a prefix for search-as-you-type
+    expression = " ".join(f'"{term}"' for term in terms) + "*"
+    fts = table("tasks_fts", column("rowid"))
+    keys = table("tasks_fts_keys", column("id"), column("task_id"))
+    score = func.bm25(literal_column("tasks_fts"))
+    stmt = (
+        select(Task)
+        .join(keys, keys.c.task_id == Task.id)
+        .join(fts, fts.c.rowid == keys.c.id)
+        .where(literal_column("tasks_fts").op("MATCH")(expression))
+    )
+    return stmt, score
+
+
+def _match_postgres(terms: List[str]):
+    query = func.to_tsquery("english", " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+    vector = literal_column("tasks.search_vector")
+    # Negated so that, as with bm25, lower scores are better matches
+    score = -func.ts_rank_cd(vector, query)
+    return select(Task).where(vector.op("@@")(query)), score
+
+
+async def full_text_search(
+    db: AsyncSession,
+    query: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    list_id: Optional[str] = None,
+) -> Tuple[List[Task], Optional[str]]:
+    """
+    Find tasks whose title or description match every term of a query.
+
+    Args:
+        db: Database session
+        query: Raw query string
+        limit: Maximum number of tasks to return
+        cursor: Cursor from a previous page, if any
+        list_id: Optional list to restrict the search to
+
+    Returns:
+        Tuple of (tasks, next_cursor), best matches first; see the module
+        docstring for how stable the cursor is across writes
+
+    Raises:
+        HTTPException: If the query has no words, the cursor is invalid, or
+            the database has no full-text search support
+    """
+    terms = search_terms(query)
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt, score = _match_sqlite(terms)
+    elif dialect == "postgresql":
+        stmt, score = _match_postgres(terms)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Search is not supported on this database",
+            headers={"X-Error-Code": "NOT_IMPLEMENTED"},
+        )
+
+    if list_id is not None:
+        stmt = stmt.where(Task.list_id == list_id)
+    if cursor:
+        value, row_id = decode_cursor(cursor, SEARCH_SORT)
+        if not isinstance(value, (int, float)):
+            raise invalid_cursor()
+        stmt = stmt.where(tuple_(score, Task.id) > tuple_(value, row_id))
+
+    stmt = stmt.add_columns(score).order_by(score, Task.id).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_task, last_score = rows[-1]
+        next_cursor = encode_cursor(SEARCH_SORT, last_score, last_task.id)
+
+    return [task for task, _ in rows], next_cursor
@@ -0,0 +1,95 @@
+"""
+Bounded LRU/TTL cache of authenticated user principals.
+
+Saves the users lookup on every authenticated request. Entries hold a plain
+snapshot of the columns routes need, never a session-bound ORM object.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Read-only snapshot of the authenticated user."""
+
+    id: str
+    username: str
+    email: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Snapshot a User row."""
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class UserCache:
+    """Least-recently-used cache of principals with a per-entry time to live."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[Principal]:
+        """
+        Look up a cached principal.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Principal if cached and not expired, otherwise None
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires, principal = entry
+        if expires <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: Principal):
+        """Cache a principal, evicting the least recently used entry when full."""
+        self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        """Drop a user's cached principal."""
+        self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Drop every cached principal."""
+        self._entries.clear()
+
+
+user_cache = UserCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    """Keep the cache coherent with user writes made through the ORM."""
+    user_cache.invalidate(target.id)
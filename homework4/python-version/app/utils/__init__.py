@@ -2,7 +2,7 @@
 Utility functions and helpers.
 """
 
-from app.utils.security import hash_password, verify_password
+from app.utils.security import hash_password, verify_password, verify_and_update_password
 from app.utils.validators import validate_uuid
 
-__all__ = ["hash_password", "verify_password", "validate_uuid"]
+__all__ = ["hash_password", "verify_password", "verify_and_update_password", "validate_uuid"]
@@ -0,0 +1,139 @@
+"""
+HTTP validators (ETag / Last-Modified) and conditional request handling.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+from starlette.responses import Response
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong entity tag from the values a representation depends on.
+
+    Args:
+        *parts: Values identifying one version of a representation
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def resource_etag(row_id: str, created_at: datetime, updated_at: Optional[datetime]) -> str:
+    """
+    ETag of a single list or task, which changes whenever the row is updated.
+
+    Args:
+        row_id: ID of the row
+        created_at: Creation timestamp
+        updated_at: Last update timestamp, if any
+
+    Returns:
+        Quoted ETag header value
+    """
+    return make_etag(row_id, (updated_at or created_at).isoformat())
+
+
+def http_date(moment: datetime) -> str:
+    """
+    Format a naive UTC timestamp as an HTTP date.
+
+    Args:
+        moment: Naive datetime in UTC, as stored in the database
+
+    Returns:
+        IMF-fixdate string, e.g. "Sun, 07 Dec 2025 18:00:00 GMT"
+    """
+    return format_datetime(moment.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """
+    Response headers carrying a representation's validators.
+
+    Args:
+        etag: Quoted ETag
+        last_modified: Naive UTC modification time, if known
+
+    Returns:
+        ETag and Last-Modified headers
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def _etag_list(header: str):
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def not_modified(
+    etag: str,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> Optional[Response]:
+    """
+    Evaluate If-None-Match / If-Modified-Since for a GET.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    it is absent, and is compared at the one-second resolution of HTTP dates.
+
+    Args:
+        etag: Current ETag of the representation
+        last_modified: Current naive UTC modification time, if known
+        if_none_match: If-None-Match request header
+        if_modified_since: If-Modified-Since request header
+
+    Returns:
+        A 304 response to send instead of the body, or None to send the body
+    """
+    headers = validator_headers(etag, last_modified)
+    if if_none_match is not None:
+        tags = _etag_list(if_none_match)
+        if "*" in tags or etag in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return None
+
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            return None
+        modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+        if modified <= since:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def check_if_match(etag: Optional[str], if_match: Optional[str]):
+    """
+    Enforce an If-Match precondition for optimistic concurrency.
+
+    Args:
+        etag: Current ETag of the resource, or None if it does not exist
+        if_match: If-Match request header, if sent
+
+    Raises:
+        HTTPException: 412 if the precondition fails
+    """
+    if if_match is None:
+        return
+    tags = [tag.strip() for tag in if_match.split(",") if tag.strip()]
+    # Strong comparison: weak tags never match
+    if etag is not None and ("*" in tags or etag in tags):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Resource has been modified",
+        headers={"X-Error-Code": "PRECONDITION_FAILED"},
+    )
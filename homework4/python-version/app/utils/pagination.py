@@ -0,0 +1,207 @@
+"""
+Keyset (cursor) pagination helpers.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Select, and_, case, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True, eq=False)
+class SortKey:
+    """
+    A column listings can be ordered by.
+
+    Attributes:
+        name: Public name, as used in ?sort= and embedded in cursors
+        column: Mapped column attribute
+        nullable: Whether the column may be NULL; NULLs always sort last
+        ranks: Optional value-to-rank mapping for columns (e.g. enums) whose
+            stored representation does not sort in their logical order
+    """
+
+    name: str
+    column: Any
+    nullable: bool = False
+    ranks: Optional[Dict[Any, int]] = None
+
+    @property
+    def expression(self):
+        """SQL expression rows are ordered by."""
+        if self.ranks is None:
+            return self.column
+        # Comparisons bind values through the column type (e.g. enum names)
+        return case(*((self.column == value, rank) for value, rank in self.ranks.items()))
+
+    def value_of(self, row: Any) -> Any:
+        """Sort value of a loaded row, as stored in a cursor."""
+        value = getattr(row, self.column.key)
+        if value is None:
+            return None
+        if self.ranks is not None:
+            return self.ranks[value]
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def parse(self, value: Any) -> Any:
+        """
+        Inverse of value_of for a value read back from a cursor.
+
+        Cursors come from clients, so the value is checked against what
+        value_of can produce before it is bound into a query.
+
+        Raises:
+            TypeError: If the value does not have the column's type
+            ValueError: If the value is not one value_of can produce
+        """
+        if value is None:
+            if not self.nullable:
+                raise TypeError(f"{self.name} cannot be null")
+            return None
+        if self.ranks is not None:
+            if type(value) is not int:
+                raise TypeError(f"{self.name} rank must be an integer")
+            if value not in self.ranks.values():
+                raise ValueError(f"Unknown {self.name} rank {value}")
+            return value
+        if isinstance(self.column.type, DateTime):
+            if not isinstance(value, str):
+                raise TypeError(f"{self.name} must be an ISO 8601 string")
+            return datetime.fromisoformat(value)
+        expected = self.column.type.python_type
+        # JSON has no int/float distinction, and bool is an int in Python
+        allowed = (int, float) if expected is float else (expected,)
+        if isinstance(value, bool) or type(value) not in allowed:
+            raise TypeError(f"{self.name} must be of type {expected.__name__}")
+        return value
+
+
+def encode_cursor(sort: str, value: Any, row_id: str) -> str:
+    """
+    Encode a (sort value, id) position as an opaque cursor.
+
+    Args:
+        sort: Sort the page was produced with, e.g. "createdAt" or "-dueDate"
+        value: JSON-compatible sort value of the last row on the page
+        row_id: ID of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([sort, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def invalid_cursor() -> HTTPException:
+    """Build the 400 error for a malformed or mismatched pagination cursor."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor",
+        headers={"X-Error-Code": "INVALID_CURSOR"},
+    )
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, str]:
+    """
+    Decode an opaque cursor back into a (sort value, id) position.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+        sort: Sort of the current request; must match the cursor's
+
+    Returns:
+        Tuple of raw sort value and row ID
+
+    Raises:
+        HTTPException: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise invalid_cursor()
+    if cursor_sort != sort or not isinstance(row_id, str):
+        raise invalid_cursor()
+    return value, row_id
+
+
+def _after(sort: SortKey, descending: bool, value: Any, row_id: str, id_column: Any):
+    """Filter for rows that come after (value, row_id) in the listing order."""
+    expression = sort.expression
+    if value is None:
+        # Cursor is inside the trailing run of NULLs, which is ordered by id
+        tie = id_column < row_id if descending else id_column > row_id
+        return and_(expression.is_(None), tie)
+
+    position = tuple_(expression, id_column)
+    bound = tuple_(value, row_id)
+    after = position < bound if descending else position > bound
+    if sort.nullable:
+        after = or_(after, expression.is_(None))
+    return after
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    model: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: Optional[SortKey] = None,
+    descending: bool = False,
+):
+    """
+    Fetch one page of rows ordered by (sort key, id).
+
+    Uses a row-value comparison against the last seen position instead of
+    OFFSET, so each page is a single index range scan regardless of depth.
+
+    Args:
+        db: Database session
+        stmt: Base select statement, already filtered
+        model: Mapped class with created_at and id columns
+        limit: Maximum number of rows to return
+        cursor: Cursor from a previous page, if any
+        sort: Sort key; defaults to creation time
+        descending: Whether to order from highest to lowest
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    if sort is None:
+        sort = SortKey("createdAt", model.created_at)
+    sort_name = f"-{sort.name}" if descending else sort.name
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_name)
+        try:
+            value = sort.parse(value)
+        except (ValueError, TypeError):
+            raise invalid_cursor()
+        stmt = stmt.where(_after(sort, descending, value, row_id, model.id))
+
+    order = [sort.expression, model.id]
+    if descending:
+        order = [column.desc() for column in order]
+    if sort.nullable:
+        order[0] = order[0].nulls_last()
+
+    result = await db.execute(stmt.order_by(*order).limit(limit + 1))
+    rows: List[Any] = list(result.scalars())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_name, sort.value_of(last), last.id)
+
+    return rows, next_cursor
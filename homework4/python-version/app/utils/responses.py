@@ -0,0 +1,47 @@
+"""
+Fast-path JSON responses for trusted ORM output.
+"""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.responses import Response
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+# Not fastapi.responses.ORJSONResponse: FastAPI deprecates it and warns on
+# every use, and the extra orjson options it turns on (non-str keys, numpy)
+# are never needed for ORM output
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered by orjson, which serializes datetimes natively."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def json_response(
+    content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Build a JSON response from already-shaped response data.
+
+    Handlers that return a Response bypass FastAPI's response_model
+    validation, so this is only for content built from trusted ORM rows
+    (e.g. TaskResponse.serialize). response_model still documents the shape.
+
+    Args:
+        content: Dicts/lists of JSON-compatible values and datetimes
+        status_code: HTTP status code
+        headers: Optional extra response headers
+
+    Returns:
+        OrjsonResponse, or a stdlib JSONResponse when ORJSON_RESPONSES is off
+    """
+    if settings.ORJSON_RESPONSES:
+        return OrjsonResponse(content, status_code=status_code, headers=headers)
+    return JSONResponse(jsonable_encoder(content), status_code=status_code, headers=headers)
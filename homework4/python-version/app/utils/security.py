@@ -2,13 +2,33 @@
 Security utilities for password hashing and verification.
 """
 
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
 from app.config import get_settings
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
 settings = get_settings()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+@lru_cache()
+def get_pwd_context() -> "CryptContext":
+    """
+    Password hashing context; hashes made with other parameters are flagged for rehash.
+
+    Built on first use so importing the app does not load passlib and argon2.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__rounds=settings.ARGON2_TIME_COST,
+        argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+        argon2__parallelism=settings.ARGON2_PARALLELISM,
+    )
 
 
 def hash_password(password: str) -> str:
@@ -21,7 +41,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -35,4 +55,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its Argon2 parameters are outdated.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        Tuple of (matches, new_hash); new_hash is None unless the stored
+        hash should be replaced with one using the current parameters
+    """
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
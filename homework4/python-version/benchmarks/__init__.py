@@ -0,0 +1,3 @@
+"""
+Seeded data generator, load driver and microbenchmarks for the API.
+"""
@@ -0,0 +1,394 @@
+"""
+Load driver for the API with scripted scenarios and a JSON baseline.
+
+Scenarios:
+    login-storm   Concurrent logins of seeded users (Argon2 verify + JWT)
+    read-polling  Clients polling task pages with If-None-Match, plus task and list reads
+    bulk-import   Batch creates of tasks into seeded lists
+
+Each scenario runs a number of concurrent clients for a fixed duration and
+reports RPS, error rate and p50/p95/p99 latency. Results can be saved as a
+baseline and later runs compared against it, failing when throughput drops
+or latency grows beyond a tolerance, on any server error, or when more
+requests fail than in the baseline. Only runs without errors are saved as
+a baseline.
+
+Usage:
+    # Seed a fresh SQLite database, start uvicorn on it and run every scenario
+    python -m benchmarks.load --spawn [--scenario read-polling] [--duration 10]
+
+    # Against a running, already seeded server
+    python -m benchmarks.load --url http://localhost:8000 --manifest data/bench.json
+
+    # Record, then gate on, a baseline
+    python -m benchmarks.load --spawn --save-baseline benchmarks/baseline.json
+    python -m benchmarks.load --spawn --baseline benchmarks/baseline.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+API = "/api/v1"
+
+
+@dataclass
+class ScenarioResult:
+    """Latencies and status codes collected while a scenario ran."""
+
+    name: str
+    clients: int
+    duration: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def record(self, started: float, status_code: int):
+        self.latencies.append(time.perf_counter() - started)
+        self.statuses[status_code] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """RPS, error rate and latency percentiles in milliseconds."""
+        count = len(self.latencies)
+        errors = sum(n for code, n in self.statuses.items() if code >= 400 or code == 0)
+        if count >= 2:
+            cuts = statistics.quantiles(self.latencies, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = self.latencies[0] if count else 0.0
+        return {
+            "clients": self.clients,
+            "requests": count,
+            "rps": round(count / self.duration, 1) if self.duration else 0.0,
+            "error_rate": round(errors / count, 4) if count else 0.0,
+            "p50_ms": round(p50 * 1000, 2),
+            "p95_ms": round(p95 * 1000, 2),
+            "p99_ms": round(p99 * 1000, 2),
+            "max_ms": round(max(self.latencies, default=0.0) * 1000, 2),
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+        }
+
+
+async def _timed(
+    result: ScenarioResult, request: Awaitable[httpx.Response]
+) -> Optional[httpx.Response]:
+    started = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError:
+        # Connection failures count as errors with status 0
+        result.record(started, 0)
+        return None
+    result.record(started, response.status_code)
+    return response
+
+
+async def login_storm(
+    client: httpx.AsyncClient,
+    manifest: Dict[str, Any],
+    result: ScenarioResult,
+    rng: random.Random,
+    deadline: float,
+):
+    """One client logging in as random seeded users until the deadline."""
+    while time.perf_counter() < deadline:
+        credentials = {
+            "username": rng.choice(manifest["usernames"]),
+            "password": manifest["password"],
+        }
+        await _timed(result, client.post(f"{API}/auth/login", json=credentials))
+
+
+async def read_polling(
+    client: httpx.AsyncClient,
+    manifest: Dict[str, Any],
+    result: ScenarioResult,
+    rng: random.Random,
+    deadline: float,
+):
+    """One client polling a few lists' task pages, revalidating with ETags."""
+    lists = rng.sample(manifest["list_ids"], min(5, len(manifest["list_ids"])))
+    etags: Dict[str, str] = {}
+    while time.perf_counter() < deadline:
+        list_id = rng.choice(lists)
+        headers = {"If-None-Match": etags[list_id]} if list_id in etags else {}
+        response = await _timed(
+            result,
+            client.get(f"{API}/lists/{list_id}/tasks", params={"limit": 50}, headers=headers),
+        )
+        if response is not None and "ETag" in response.headers:
+            etags[list_id] = response.headers["ETag"]
+        if manifest["task_ids"]:
+            await _timed(result, client.get(f"{API}/tasks/{rng.choice(manifest['task_ids'])}"))
+        await _timed(result, client.get(f"{API}/lists/{list_id}"))
+
+
+async def bulk_import(
+    client: httpx.AsyncClient,
+    manifest: Dict[str, Any],
+    result: ScenarioResult,
+    rng: random.Random,
+    deadline: float,
+    batch_size: int = 200,
+):
+    """One client importing batches of new tasks until the deadline."""
+    while time.perf_counter() < deadline:
+        operations = [
+            {
+                "op": "create",
+                "data": {
+                    "title": f"Imported task {rng.getrandbits(32):08x}",
+                    "priority": rng.choice(["low", "medium", "high"]),
+                    "categories": rng.sample(["import", "work", "home"], rng.randint(0, 2)),
+                },
+            }
+            for _ in range(batch_size)
+        ]
+        list_id = rng.choice(manifest["list_ids"])
+        await _timed(
+            result,
+            client.post(f"{API}/lists/{list_id}/tasks/batch", json={"operations": operations}),
+        )
+
+
+SCENARIOS: Dict[str, Callable[..., Awaitable[None]]] = {
+    "login-storm": login_storm,
+    "read-polling": read_polling,
+    "bulk-import": bulk_import,
+}
+# Concurrent clients per scenario unless --clients is given. Imports are few
+# and large: SQLite serializes writers, so many concurrent batches mostly
+# measure lock waits.
+DEFAULT_CLIENTS = {"login-storm": 16, "read-polling": 32, "bulk-import": 4}
+
+
+async def run_scenario(
+    base_url: str, name: str, manifest: Dict[str, Any], clients: int, duration: float, seed: int
+) -> ScenarioResult:
+    """
+    Run one scenario with concurrent clients for a fixed duration.
+
+    Args:
+        base_url: Server URL, e.g. http://127.0.0.1:8000
+        name: Scenario name (see SCENARIOS)
+        manifest: Seed manifest with usernames, password, list and task IDs
+        clients: Number of concurrent clients
+        duration: Seconds to run
+        seed: Random seed for the clients' choices
+
+    Returns:
+        Collected latencies and status codes
+    """
+    result = ScenarioResult(name=name, clients=clients)
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                SCENARIOS[name](client, manifest, result, random.Random(seed + index), deadline)
+                for index in range(clients)
+            )
+        )
+        result.duration = time.perf_counter() - started
+    return result
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Compare scenario summaries with a baseline.
+
+    Args:
+        results: Summaries of this run, by scenario
+        baseline: Previously saved baseline
+        tolerance: Allowed relative drop in RPS / growth in p95 and p99, e.g. 0.2.
+            Errors have no tolerance.
+
+    Returns:
+        One message per regression; empty if none
+    """
+    regressions = []
+    for name, summary in results.items():
+        # 5xx, and connection failures recorded as status 0
+        server_errors = {
+            code: n for code, n in summary["statuses"].items() if not 0 < int(code) < 500
+        }
+        if server_errors:
+            regressions.append(f"{name}: server errors {server_errors}")
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        if summary["rps"] < reference["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {summary['rps']} < baseline {reference['rps']}")
+        for key in ("p95_ms", "p99_ms"):
+            if summary[key] > reference[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {summary[key]} > baseline {reference[key]}")
+        if summary["error_rate"] > reference["error_rate"]:
+            regressions.append(
+                f"{name}: error_rate {summary['error_rate']} > baseline {reference['error_rate']}"
+            )
+    return regressions
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(database_url: str, workers: int) -> Tuple[subprocess.Popen, str]:
+    """
+    Start uvicorn on a free port, with request logging turned down.
+
+    Returns:
+        Tuple of the server process and its base URL, once it reports healthy
+    """
+    port = _free_port()
+    env = {**os.environ, "DATABASE_URL": database_url, "LOG_LEVEL": "warning"}
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}{API}/health", timeout=1.0).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become healthy within 30s")
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running, seeded server")
+    target.add_argument("--spawn", action="store_true", help="Seed SQLite and start uvicorn")
+    parser.add_argument("--manifest", help="Seed manifest (required with --url)")
+    parser.add_argument(
+        "--scenario",
+        choices=list(SCENARIOS),
+        action="append",
+        help="Scenario to run; repeat for several (default: all)",
+    )
+    parser.add_argument("--clients", type=int, help="Concurrent clients for every scenario")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers with --spawn")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--lists", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--baseline", help="Compare against this baseline and exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", help="Write this run's results as a baseline")
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.spawn:
+            from benchmarks.seed import seed
+
+            database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+            manifest = asyncio.run(
+                seed(database_url, args.users, args.lists, args.tasks, args.seed)
+            )
+            server, base_url = spawn_server(database_url, args.workers)
+        else:
+            if not args.manifest:
+                parser.error("--manifest is required with --url")
+            with open(args.manifest) as handle:
+                manifest = json.load(handle)
+            base_url = args.url
+
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            # Bulk import runs last: it changes the data the other scenarios read
+            for name in [name for name in SCENARIOS if name in (args.scenario or SCENARIOS)]:
+                clients = args.clients or DEFAULT_CLIENTS[name]
+                result = asyncio.run(
+                    run_scenario(base_url, name, manifest, clients, args.duration, args.seed)
+                )
+                results[name] = result.summary()
+                summary = results[name]
+                print(
+                    f"{name:<13} {summary['rps']:>9.1f} rps  p50 {summary['p50_ms']:>8.2f} ms  "
+                    f"p95 {summary['p95_ms']:>8.2f} ms  p99 {summary['p99_ms']:>8.2f} ms  "
+                    f"errors {summary['error_rate']:.2%}  {summary['statuses']}"
+                )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "parameters": {
+            "duration": args.duration,
+            "workers": args.workers,
+            "seed": args.seed,
+            "data": manifest.get("counts"),
+        },
+        "scenarios": results,
+    }
+    if args.save_baseline:
+        failing = [name for name, summary in results.items() if summary["error_rate"]]
+        if failing:
+            print(f"Not saving a baseline: requests failed in {', '.join(failing)}")
+            sys.exit(1)
+        with open(args.save_baseline, "w") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
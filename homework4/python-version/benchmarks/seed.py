@@ -0,0 +1,201 @@
+"""
+Seeded data generator for benchmarks.
+
+Creates N users, M lists and K tasks with deterministic content for a given
+seed, and writes a manifest of credentials and IDs for the load driver.
+Every user shares one password, hashed once with the configured Argon2
+parameters, so logins cost what they cost in production.
+
+Usage:
+    python -m benchmarks.seed --database-url sqlite:///./data/bench.db \\
+        --users 50 --lists 200 --tasks 20000 [--seed 1234] [--manifest data/bench.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+
+from app.database import Base, create_engine_for
+from app.models import Task, TaskCategory, TodoList, User
+from app.models.task import PriorityEnum
+from app.utils.security import hash_password
+
+PASSWORD = "benchmark-password"
+CATEGORIES = ["work", "home", "errands", "health", "finance", "travel", "reading", "garden"]
+WORDS = [
+    "buy",
+    "call",
+    "email",
+    "fix",
+    "plan",
+    "review",
+    "book",
+    "pay",
+    "clean",
+    "write",
+    "milk",
+    "report",
+    "dentist",
+    "invoice",
+    "flight",
+    "garage",
+    "taxes",
+    "meeting",
+    "notes",
+]
+CHUNK_SIZE = 1000
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def generate(users: int, lists: int, tasks: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build the rows to insert, deterministically for a seed.
+
+    Args:
+        users: Number of users
+        lists: Number of lists, assigned to users round-robin
+        tasks: Number of tasks, spread over lists at random
+        seed: Random seed
+
+    Returns:
+        Rows per table: users, lists, tasks and task_categories
+    """
+    rng = random.Random(seed)
+    epoch = datetime(2025, 1, 1)
+    password_hash = hash_password(PASSWORD)
+
+    user_rows = [
+        {
+            "id": _uuid(rng),
+            "username": f"bench{index:05d}",
+            "email": f"bench{index:05d}@example.com",
+            "password_hash": password_hash,
+            "created_at": epoch,
+        }
+        for index in range(users)
+    ]
+    list_rows = [
+        {
+            "id": _uuid(rng),
+            "name": f"{_phrase(rng, 2)} {index}",
+            "description": _phrase(rng, 6),
+            "user_id": user_rows[index % users]["id"] if users else None,
+            "created_at": epoch,
+            "revision": 0,
+        }
+        for index in range(lists)
+    ]
+
+    task_rows: List[Dict[str, Any]] = []
+    category_rows: List[Dict[str, Any]] = []
+    for index in range(tasks if lists else 0):
+        task_list = rng.choice(list_rows)
+        task_list["revision"] += 1
+        task_id = _uuid(rng)
+        task_rows.append(
+            {
+                "id": task_id,
+                "list_id": task_list["id"],
+                "title": _phrase(rng, rng.randint(2, 5)),
+                "description": _phrase(rng, rng.randint(5, 20)) if rng.random() < 0.6 else None,
+                "completed": rng.random() < 0.3,
+                "due_date": (
+                    epoch + timedelta(hours=rng.randint(0, 24 * 365))
+                    if rng.random() < 0.5
+                    else None
+                ),
+                "priority": rng.choice([None, *PriorityEnum]),
+                "created_at": epoch + timedelta(seconds=index),
+                "revision": task_list["revision"],
+            }
+        )
+        for position, category in enumerate(rng.sample(CATEGORIES, rng.randint(0, 3))):
+            category_rows.append({"task_id": task_id, "position": position, "category": category})
+
+    return {
+        "users": user_rows,
+        "lists": list_rows,
+        "tasks": task_rows,
+        "task_categories": category_rows,
+    }
+
+
+async def seed(database_url: str, users: int, lists: int, tasks: int, seed: int) -> Dict[str, Any]:
+    """
+    Create the schema if needed and insert a generated data set.
+
+    Args:
+        database_url: Database to seed
+        users: Number of users
+        lists: Number of lists
+        tasks: Number of tasks
+        seed: Random seed
+
+    Returns:
+        Manifest with the shared password, usernames, list IDs and a sample of task IDs
+    """
+    rows = generate(users, lists, tasks, seed)
+    engine = create_engine_for(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            for model, key in (
+                (User, "users"),
+                (TodoList, "lists"),
+                (Task, "tasks"),
+                (TaskCategory, "task_categories"),
+            ):
+                table_rows = rows[key]
+                for start in range(0, len(table_rows), CHUNK_SIZE):
+                    await conn.execute(
+                        insert(model.__table__), table_rows[start : start + CHUNK_SIZE]
+                    )
+    finally:
+        await engine.dispose()
+
+    return {
+        "seed": seed,
+        "password": PASSWORD,
+        "usernames": [row["username"] for row in rows["users"]],
+        "list_ids": [row["id"] for row in rows["lists"]],
+        "task_ids": [row["id"] for row in rows["tasks"][:1000]],
+        "counts": {key: len(value) for key, value in rows.items()},
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--lists", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--manifest", help="Write the manifest JSON here (default: stdout)")
+    args = parser.parse_args()
+
+    manifest = asyncio.run(seed(args.database_url, args.users, args.lists, args.tasks, args.seed))
+    output = json.dumps(manifest, indent=2)
+    if args.manifest:
+        with open(args.manifest, "w") as handle:
+            handle.write(output)
+        print(f"Seeded {manifest['counts']} into {args.database_url}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Microbenchmarks for per-request hot paths.
+
+Run with:
+    uv run pytest benchmarks --benchmark-only [--benchmark-json=benchmarks/micro.json]
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.task import PriorityEnum, Task
+from app.schemas.task import TaskResponse
+from app.services.jwt import create_access_token, verify_token
+from app.utils.security import hash_password, verify_password
+from app.utils.validators import validate_uuid
+
+
+@pytest.fixture(scope="module")
+def task():
+    """A fully populated task, as loaded for a response."""
+    task = Task(
+        id=str(uuid.uuid4()),
+        list_id=str(uuid.uuid4()),
+        title="Review the quarterly report",
+        description="Check the numbers against last quarter and send notes",
+        completed=False,
+        due_date=datetime(2026, 3, 1, 9, 30),
+        priority=PriorityEnum.HIGH,
+        created_at=datetime(2026, 1, 1, 8, 0),
+        updated_at=datetime(2026, 1, 2, 8, 0),
+    )
+    task.categories_list = ["work", "finance"]
+    return task
+
+
+def test_task_response_from_orm(benchmark, task):
+    result = benchmark(TaskResponse.from_orm, task)
+    assert result.categories == ["work", "finance"]
+
+
+def test_task_response_serialize(benchmark, task):
+    result = benchmark(TaskResponse.serialize, task)
+    assert result["priority"] == "high"
+
+
+def test_verify_token(benchmark):
+    token = create_access_token({"sub": str(uuid.uuid4())})
+    assert "sub" in benchmark(verify_token, token)
+
+
+def test_create_access_token(benchmark):
+    assert benchmark(create_access_token, {"sub": str(uuid.uuid4())})
+
+
+def test_verify_password(benchmark):
+    # Argon2 with the configured cost takes tens to hundreds of milliseconds
+    hashed = hash_password("benchmark-password")
+    assert benchmark.pedantic(
+        verify_password, args=("benchmark-password", hashed), rounds=10, iterations=1
+    )
+
+
+def test_validate_uuid(benchmark):
+    value = str(uuid.uuid4())
+    assert benchmark(validate_uuid, value, "Task ID") == value
+
+
+def test_validate_uuid_invalid(benchmark):
+    def reject():
+        try:
+            validate_uuid("not-a-uuid", "Task ID")
+        except HTTPException:
+            return True
+        return False
+
+    assert benchmark(reject)
@@ -2,56 +2,91 @@
 Pytest configuration and fixtures for testing.
 """
 
+import asyncio
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db, install_sqlite_pragmas
+from app.metrics import count_queries, instrument_engine
 from app.models import User, TodoList, Task, TokenBlacklist
+from app.services.revocation import revocation_cache
+from app.services.user_cache import user_cache
 
 # Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+install_sqlite_pragmas(engine)
+instrument_engine(engine, "primary")
+
+TestingSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async def _run_schema(method):
+    async with engine.begin() as conn:
+        await conn.run_sync(method)
 
 
 @pytest.fixture(scope="function")
 def db():
     """Create a fresh database for each test."""
-    Base.metadata.create_all(bind=engine)
+    asyncio.run(_run_schema(Base.metadata.create_all))
     db = TestingSessionLocal()
     try:
         yield db
     finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+        asyncio.run(db.close())
+        asyncio.run(_run_schema(Base.metadata.drop_all))
 
 
 @pytest.fixture(scope="function")
 def client(db):
     """Create a test client with database override."""
 
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+    async def override_get_db():
+        # Like production, each request gets its own session on the shared engine
+        async with TestingSessionLocal() as session:
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    revocation_cache.reset()
+    user_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """
+    Context manager asserting that a block runs at most `limit` database statements.
+
+    Usage: `with query_budget(2): client.get(...)`. Keeps N+1 lazy loads and
+    other per-row queries from creeping into endpoints.
+    """
+
+    @contextmanager
+    def check(limit: int):
+        with count_queries() as counter:
+            yield counter
+        assert counter.count <= limit, (
+            f"{counter.count} statements exceeded the budget of {limit}:\n"
+            + "\n".join(counter.statements)
+        )
+
+    return check
+
+
 @pytest.fixture
 def test_user(client):
     """Create a test user and return user data with token."""
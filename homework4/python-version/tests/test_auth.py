@@ -2,18 +2,36 @@
 Tests for authentication endpoints.
 """
 
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from passlib.hash import argon2
+from prometheus_client import REGISTRY
+from sqlalchemy import select
+
+from app import calibrate
+from app.models import TokenBlacklist, User
+from app.services import revocation
+from app.services.hashing import PasswordExecutor
+from app.services.revocation import RevocationCache, revocation_cache, token_key
+from app.services.user_cache import user_cache
+from app.utils.security import get_pwd_context
 
 
-def test_signup_success(client):
+def test_signup_success(client, query_budget):
     """Test successful user registration."""
     user_data = {
         "username": "newuser",
         "email": "newuser@example.com",
         "password": "password123"
     }
-    response = client.post("/api/v1/auth/signup", json=user_data)
+    with query_budget(3):
+        response = client.post("/api/v1/auth/signup", json=user_data)
 
     assert response.status_code == 201
     data = response.json()
@@ -74,13 +92,14 @@ def test_signup_short_password(client):
     assert response.status_code == 422
 
 
-def test_login_success(client, test_user):
+def test_login_success(client, test_user, query_budget):
     """Test successful login."""
     credentials = {
         "username": "testuser",
         "password": "testpass123"
     }
-    response = client.post("/api/v1/auth/login", json=credentials)
+    with query_budget(1):
+        response = client.post("/api/v1/auth/login", json=credentials)
 
     assert response.status_code == 200
     data = response.json()
@@ -113,9 +132,10 @@ def test_login_nonexistent_user(client):
     assert "invalid" in response.json()["detail"].lower()
 
 
-def test_logout_success(client, auth_headers):
+def test_logout_success(client, auth_headers, query_budget):
     """Test successful logout."""
-    response = client.post("/api/v1/auth/logout", headers=auth_headers)
+    with query_budget(4):
+        response = client.post("/api/v1/auth/logout", headers=auth_headers)
 
     assert response.status_code == 204
 
@@ -141,3 +161,197 @@ def test_token_blacklisted_after_logout(client, test_user):
     response = client.get("/api/v1/users/profile", headers=headers)
     assert response.status_code == 401
     assert "revoked" in response.json()["detail"].lower()
+
+
+def test_revocation_from_other_worker_is_synced(client, db, test_user):
+    """Test that a blacklist row written elsewhere is picked up by the cache sync."""
+
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    assert client.get("/api/v1/users/profile", headers=headers).status_code == 200
+
+    async def revoke():
+        db.add(TokenBlacklist(
+            token=test_user["token"],
+            user_id=test_user["user"]["id"],
+            expires_at=datetime.now() + timedelta(hours=1),
+        ))
+        await db.commit()
+
+    asyncio.run(revoke())
+    revocation_cache._next_sync = 0.0
+
+    response = client.get("/api/v1/users/profile", headers=headers)
+    assert response.status_code == 401
+    assert "revoked" in response.json()["detail"].lower()
+
+
+def test_revocation_cache_bloom_fast_path():
+    """Test that unknown tokens are rejected by the Bloom filter without a lookup."""
+
+    cache = RevocationCache(max_size=2, sync_interval=60, bloom_bits=1024, bloom_hashes=4)
+    for i in range(3):
+        cache.add(f"token-{i}", time.time() + 60 + i)
+
+    # Oldest entry was evicted from the exact set but stays in the filter
+    assert cache._bloom.might_contain(token_key("token-0"))
+    assert token_key("token-0") not in cache._revoked
+    assert token_key("token-2") in cache._revoked
+    assert not cache._bloom.might_contain(token_key("live-token"))
+
+
+def test_revocation_bloom_rebuilt_only_when_mostly_stale(monkeypatch):
+    """Test that the filter keeps growing in place until half of it has expired."""
+
+    now = time.time()
+    cache = RevocationCache(max_size=100, sync_interval=60, bloom_bits=4096, bloom_hashes=4)
+    cache.add("shortest", now + 1)
+    for i in range(3):
+        cache.add(f"short-{i}", now + 10)
+    cache.add("long", now + 3600)
+    bloom = cache._bloom
+
+    # One of five keys expired: below the stale ratio, so nothing is rebuilt
+    monkeypatch.setattr(revocation.time, "time", lambda: now + 5)
+    cache._expire()
+    asyncio.run(cache._rebuild_bloom())
+    assert cache._bloom is bloom
+
+    monkeypatch.setattr(revocation.time, "time", lambda: now + 20)
+    cache._expire()
+    asyncio.run(cache._rebuild_bloom())
+    assert cache._bloom is not bloom
+    assert cache._bloom.might_contain(token_key("long"))
+    assert list(cache._revoked) == [token_key("long")]
+    assert (cache._bloom_keys, cache._stale_keys) == (1, 0)
+
+
+def test_profile_served_from_user_cache(client, db, auth_headers, test_user, query_budget):
+    """Test that the principal is cached and invalidated on user updates."""
+
+    with query_budget(2):
+        assert client.get("/api/v1/users/profile", headers=auth_headers).status_code == 200
+    assert user_cache.get(test_user["user"]["id"]) is not None
+    # Later requests hit neither the blacklist nor the users table, and do
+    # not even check out a connection
+    def checkouts():
+        return REGISTRY.get_sample_value(
+            "db_pool_checkout_wait_seconds_count", {"engine": "primary"}
+        )
+
+    before = checkouts()
+    with query_budget(0):
+        assert client.get("/api/v1/users/profile", headers=auth_headers).status_code == 200
+    assert checkouts() == before
+
+    async def rename():
+        user = await db.get(User, test_user["user"]["id"])
+        user.username = "renamed"
+        await db.commit()
+
+    asyncio.run(rename())
+    assert user_cache.get(test_user["user"]["id"]) is None
+
+    response = client.get("/api/v1/users/profile", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "renamed"
+
+
+def test_password_executor_rejects_when_saturated():
+    """Test that password work beyond the pool and queue is rejected with 429."""
+
+    pool = PasswordExecutor(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(lambda: True)
+        release.set()
+        await busy
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    pool.shutdown()
+
+    assert error.status_code == 429
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["completed"] == 1
+
+
+def test_password_executor_counts_jobs_of_cancelled_requests():
+    """Test that a job keeps its slot until it finishes, even if its request is gone."""
+    pool = PasswordExecutor(workers=1, max_queue=0)
+    release = threading.Event()
+    started = threading.Event()
+
+    def job():
+        started.set()
+        release.wait()
+
+    async def scenario():
+        request = asyncio.ensure_future(pool.run(job))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                # Would queue behind the still-running job if it were not counted
+                await asyncio.wait_for(pool.run(lambda: True), timeout=5)
+        finally:
+            release.set()
+        for _ in range(100):
+            if not pool.stats()["in_flight"]:
+                break
+            await asyncio.sleep(0.01)
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    pool.shutdown()
+
+    assert error.status_code == 429
+    assert pool.stats()["in_flight"] == 0
+
+
+def test_calibrate_never_goes_below_minimum_memory(monkeypatch):
+    """Test that calibration stops halving memory at the floor and reports a missed target."""
+    measured = []
+
+    def slow_verify(time_cost, memory_cost, parallelism, samples):
+        measured.append(memory_cost)
+        return 500.0
+
+    monkeypatch.setattr(calibrate, "measure_verify_ms", slow_verify)
+
+    with pytest.raises(ValueError, match="over the 250 ms target"):
+        calibrate.calibrate(250, 65536, 4)
+    assert measured == [65536, 32768, calibrate.MIN_MEMORY_COST]
+
+    with pytest.raises(ValueError, match="below the minimum"):
+        calibrate.calibrate(250, 8 * 4, 4)
+
+
+def test_login_rehashes_outdated_password_hash(client, db):
+    """Test that a hash made with old Argon2 parameters is upgraded on login."""
+
+    old_hash = argon2.using(rounds=1, memory_cost=1024, parallelism=1).hash("password123")
+
+    async def create_user():
+        db.add(User(username="legacy", email="legacy@example.com", password_hash=old_hash))
+        await db.commit()
+
+    async def stored_hash():
+        result = await db.execute(select(User.password_hash).where(User.username == "legacy"))
+        return result.scalar_one()
+
+    asyncio.run(create_user())
+    response = client.post(
+        "/api/v1/auth/login", json={"username": "legacy", "password": "password123"}
+    )
+
+    assert response.status_code == 200
+    new_hash = asyncio.run(stored_hash())
+    assert new_hash != old_hash
+    assert not get_pwd_context().needs_update(new_hash)
+    assert get_pwd_context().verify("password123", new_hash)
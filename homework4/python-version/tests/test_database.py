@@ -0,0 +1,244 @@
+"""
+Tests for database engine configuration.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+from sqlalchemy import column, insert, select, table, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app import database
+from app.database import (
+    ReadSession,
+    ReplicaSet,
+    RoutingSession,
+    async_database_url,
+    engine_options,
+    install_sqlite_pragmas,
+)
+from app.metrics import count_queries
+from app.migrate import alembic_config, current_revision, head_revision
+
+# Cumulative import time of app.main; generous so slow CI hosts stay green
+IMPORT_TIME_BUDGET_MS = 2500
+# Loaded on first use, never by importing the app
+DEFERRED_MODULES = ("passlib", "argon2", "jose.jwt", "cryptography", "psutil", "alembic")
+
+
+def test_sqlite_profile(tmp_path):
+    """Test that file-backed SQLite gets WAL, the tuned pragmas and a fixed pool."""
+    url = f"sqlite:///{tmp_path}/profile.db"
+    engine = create_async_engine(async_database_url(url), **engine_options(url))
+    install_sqlite_pragmas(engine)
+
+    async def read_pragmas():
+        async with engine.connect() as conn:
+            pragmas = {
+                name: (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+                for name in ("journal_mode", "synchronous", "busy_timeout", "foreign_keys")
+            }
+        await engine.dispose()
+        return pragmas
+
+    assert asyncio.run(read_pragmas()) == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "busy_timeout": 5000,
+        "foreign_keys": 1,
+    }
+    assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+    assert engine.pool._pre_ping is False
+
+
+def test_concurrent_sqlite_writers(tmp_path):
+    """Test that concurrent writers wait for the lock instead of failing."""
+    url = f"sqlite:///{tmp_path}/writers.db"
+    engine = create_async_engine(async_database_url(url), **engine_options(url))
+    install_sqlite_pragmas(engine)
+
+    async def writer(n):
+        for i in range(20):
+            async with engine.begin() as conn:
+                await conn.execute(text("INSERT INTO t (v) VALUES (:v)"), {"v": n * 100 + i})
+
+    async def run():
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (v INTEGER)"))
+        await asyncio.gather(*(writer(n) for n in range(8)))
+        async with engine.connect() as conn:
+            count = (await conn.execute(text("SELECT count(*) FROM t"))).scalar()
+        await engine.dispose()
+        return count
+
+    assert asyncio.run(run()) == 160
+
+
+def _routing_setup(tmp_path):
+    """Primary and replica SQLite files holding different rows in the same table."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/primary.db")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db")
+
+    async def seed():
+        for name, target in (("primary", primary), ("replica", replica)):
+            async with target.begin() as conn:
+                await conn.execute(text("CREATE TABLE t (v TEXT)"))
+                await conn.execute(text("INSERT INTO t (v) VALUES (:v)"), {"v": name})
+
+    asyncio.run(seed())
+    return primary, replica
+
+
+def test_routing_session_reads_replica_until_first_write(tmp_path):
+    """Test that reads go to the replica and stick to the primary after a write."""
+    primary, replica = _routing_setup(tmp_path)
+    factory = async_sessionmaker(bind=primary, sync_session_class=RoutingSession)
+
+    async def run():
+        async with factory(replica=replica.sync_engine) as db:
+            before = (await db.execute(select(text("v")).select_from(text("t")))).scalar()
+            await db.execute(text("SELECT 1"))
+            await db.execute(insert(table("t", column("v"))).values(v="written"))
+            after = sorted((await db.execute(select(text("v")).select_from(text("t")))).scalars())
+            await db.commit()
+        await primary.dispose()
+        await replica.dispose()
+        return before, after
+
+    assert asyncio.run(run()) == ("replica", ["primary", "written"])
+
+
+def _read_sessions(monkeypatch, primary, replica):
+    """Point get_read_db at a primary and a single replica."""
+    replica_set = ReplicaSet([replica], retry_interval=60)
+    monkeypatch.setattr(database, "replicas", replica_set)
+    monkeypatch.setattr(
+        database,
+        "ReadSessionLocal",
+        async_sessionmaker(bind=primary, class_=ReadSession, sync_session_class=RoutingSession),
+    )
+    return replica_set
+
+
+def test_get_read_db_falls_back_to_primary(tmp_path, monkeypatch):
+    """Test that an unreachable replica is skipped and reads use the primary."""
+    primary, _ = _routing_setup(tmp_path)
+    unreachable = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db")
+    replica_set = _read_sessions(monkeypatch, primary, unreachable)
+
+    async def run():
+        async for db in database.get_read_db():
+            # Nothing connects until the first statement
+            connected = db.sync_session.in_transaction()
+            value = (await db.execute(select(text("v")).select_from(text("t")))).scalar()
+            routed_to_replica = db.sync_session.replica is not None
+        await primary.dispose()
+        return connected, value, routed_to_replica
+
+    assert asyncio.run(run()) == (False, "primary", False)
+    assert replica_set.choose() is None
+
+
+def test_get_read_db_falls_back_when_a_replica_query_fails(tmp_path, monkeypatch):
+    """Test that a query failing on a reachable replica is retried on the primary."""
+    primary, _ = _routing_setup(tmp_path)
+    # Reachable, but missing the table, as a replica mid-restore would be
+    empty = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/empty.db")
+    replica_set = _read_sessions(monkeypatch, primary, empty)
+
+    async def run():
+        async for db in database.get_read_db():
+            value = await db.scalar(select(text("v")).select_from(text("t")))
+        await primary.dispose()
+        await empty.dispose()
+        return value
+
+    assert asyncio.run(run()) == "primary"
+    assert replica_set.choose() is None
+
+
+def test_migrations_build_the_models_schema(tmp_path, monkeypatch):
+    """Test that the Alembic revisions match the models and a current database is cheap."""
+    from alembic import command
+    from sqlalchemy import inspect
+
+    engine = database.create_engine_for(f"sqlite:///{tmp_path}/init.db")
+    monkeypatch.setattr(database, "engine", engine)
+
+    async def init():
+        monkeypatch.setattr(database, "_db_initialized", False)
+        with count_queries() as counter:
+            await database.init_db()
+        return counter.count
+
+    async def run():
+        await init()
+        again = await init()
+        async with engine.connect() as conn:
+            # Raises if autogenerate finds differences between revisions and models
+            await conn.run_sync(lambda sync_conn: command.check(alembic_config(sync_conn)))
+            revision = await conn.run_sync(current_revision)
+            tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            foreign_keys = (await conn.execute(text("PRAGMA foreign_keys"))).scalar()
+        await engine.dispose()
+        return again, revision, tables, foreign_keys
+
+    again, revision, tables, foreign_keys = asyncio.run(run())
+    assert again <= 5
+    assert revision == head_revision()
+    assert {"users", "lists", "tasks", "task_categories", "tasks_fts"} <= set(tables)
+    assert foreign_keys == 1
+
+
+def test_pre_alembic_database_is_adopted(tmp_path, monkeypatch):
+    """Test that a database built by create_all keeps its data and is stamped at head."""
+    engine = database.create_engine_for(f"sqlite:///{tmp_path}/legacy.db")
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "_db_initialized", False)
+
+    async def run():
+        async with engine.begin() as conn:
+            await conn.run_sync(database.Base.metadata.create_all)
+            await conn.execute(
+                text(
+                    "INSERT INTO users (id, username, email, password_hash, created_at) "
+                    "VALUES ('u1', 'old', 'old@example.com', 'x', '2025-01-01 00:00:00')"
+                )
+            )
+        await database.init_db()
+        async with engine.connect() as conn:
+            revision = await conn.run_sync(current_revision)
+            users = (await conn.execute(text("SELECT username FROM users"))).scalars().all()
+        await engine.dispose()
+        return revision, users
+
+    assert asyncio.run(run()) == (head_revision(), ["old"])
+
+
+def test_cold_import_stays_within_budget():
+    """Test that importing the app defers heavy modules and stays within its time budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | name", nested names indented
+    imports = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                imports[name.strip()] = int(cumulative)
+
+    loaded = [
+        name
+        for name in imports
+        if any(name == module or name.startswith(module + ".") for module in DEFERRED_MODULES)
+    ]
+    assert loaded == []
+    assert imports["app.main"] / 1000 < IMPORT_TIME_BUDGET_MS
@@ -2,8 +2,16 @@
 Tests for health check endpoint.
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.main import settings
+from app.metrics import instrument_engine
 
 
 def test_health_check(client):
@@ -47,3 +55,85 @@ def test_root_endpoint(client):
     assert "name" in data
     assert "version" in data
     assert "health" in data
+
+
+def test_metrics_endpoint(client):
+    """Test that /metrics exposes per-route latency and query counts."""
+    route = {"method": "POST", "route": "/api/v1/lists"}
+
+    def sample(name, labels=route):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    before_requests = sample("http_request_duration_seconds_count", {**route, "status": "201"})
+    before_queries = sample("http_request_db_queries_sum")
+    client.post("/api/v1/lists", json={"title": "Measured"})
+
+    assert sample("http_request_duration_seconds_count", {**route, "status": "201"}) == (
+        before_requests + 1
+    )
+    assert sample("http_request_db_queries_sum") > before_queries
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_bucket{le="0.005",method="POST",route="/api/v1/lists"'
+        in body
+    )
+    assert "threadpool_queue_depth" in body
+    assert 'db_pool_checkout_wait_seconds_count{engine="primary"}' in body
+
+
+def test_metrics_label_routes_by_template(client):
+    """Test that requests are labelled with their route template, not their path."""
+    list_id = client.post("/api/v1/lists", json={"title": "Templated"}).json()["id"]
+    client.get(f"/api/v1/lists/{list_id}/tasks")
+
+    assert REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count",
+        {"method": "GET", "route": "/api/v1/lists/{list_id}/tasks", "status": "200"},
+    )
+
+
+def test_pool_wait_survives_engine_dispose():
+    """Test that checkouts are still timed on the pool dispose() swaps in."""
+
+    def checkouts():
+        return (
+            REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count", {"engine": "disposed"})
+            or 0
+        )
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine, "disposed")
+        async with AsyncSession(engine) as session:
+            await session.execute(text("SELECT 1"))
+        first = checkouts()
+        # As app.server does before forking, and again in each worker
+        await engine.dispose()
+        engine.sync_engine.dispose(close=False)
+        async with AsyncSession(engine) as session:
+            await session.execute(text("SELECT 1"))
+            # Statements on the checked out connection are not checkouts
+            await session.execute(text("SELECT 2"))
+        await engine.dispose()
+        return first
+
+    first = asyncio.run(run())
+    assert first >= 1
+    assert checkouts() == first + 1
+
+
+def test_query_budget_logs_expensive_requests(client, monkeypatch, caplog):
+    """Test that requests over QUERY_BUDGET are logged with their route."""
+    list_id = client.post("/api/v1/lists", json={"title": "Budgeted"}).json()["id"]
+    monkeypatch.setattr(settings, "QUERY_BUDGET", 1)
+
+    with caplog.at_level("WARNING", logger="app.main"):
+        client.get(f"/api/v1/lists/{list_id}")
+        assert "Query budget exceeded" not in caplog.text
+        client.get(f"/api/v1/lists/{list_id}/tasks")
+
+    assert "GET /api/v1/lists/{list_id}/tasks ran 2 statements (budget 1)" in caplog.text
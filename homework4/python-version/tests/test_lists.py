@@ -139,3 +139,89 @@ def test_delete_list_not_found(client):
     response = client.delete(f"/api/v1/lists/{fake_uuid}")
 
     assert response.status_code == 404
+
+
+def test_get_all_lists_paginated(client, query_budget):
+    """Test walking all lists page by page with the next cursor."""
+    created = []
+    for i in range(5):
+        response = client.post("/api/v1/lists", json={"title": f"List {i}"})
+        assert response.status_code == 201
+        created.append(response.json()["id"])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        with query_budget(1):
+            response = client.get("/api/v1/lists", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(lst["id"] for lst in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == created
+
+
+def test_get_all_lists_invalid_cursor(client):
+    """Test retrieving lists with a malformed cursor."""
+    response = client.get("/api/v1/lists", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+def test_delete_list_cascades_in_database(client, query_budget):
+    """Test that deleting a list removes its tasks through ON DELETE CASCADE."""
+    list_id = client.post("/api/v1/lists", json={"title": "Cascade"}).json()["id"]
+    task_ids = [
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": f"Task {i}"}).json()["id"]
+        for i in range(3)
+    ]
+
+    # One DELETE however many tasks the list has: the database cascades, not the ORM
+    with query_budget(1):
+        assert client.delete(f"/api/v1/lists/{list_id}").status_code == 204
+    assert client.delete(f"/api/v1/lists/{list_id}").status_code == 404
+    for task_id in task_ids:
+        assert client.get(f"/api/v1/tasks/{task_id}").status_code == 404
+
+
+def test_list_crud_query_budgets(client, query_budget):
+    """Test that each list CRUD request runs a single statement."""
+    with query_budget(1):
+        response = client.post("/api/v1/lists", json={"title": "Budget", "description": "d"})
+    assert response.status_code == 201
+    list_id = response.json()["id"]
+
+    with query_budget(1):
+        assert client.get("/api/v1/lists").status_code == 200
+    with query_budget(1):
+        assert client.get(f"/api/v1/lists/{list_id}").status_code == 200
+    with query_budget(1):
+        response = client.patch(f"/api/v1/lists/{list_id}", json={"title": "Renamed"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    with query_budget(1):
+        assert client.delete(f"/api/v1/lists/{list_id}").status_code == 204
+
+
+def test_get_list_conditional_and_if_match(client):
+    """Test validators, 304 and If-Match for a single list."""
+    created = client.post("/api/v1/lists", json={"title": "Cached"}).json()
+    url = f"/api/v1/lists/{created['id']}"
+
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": f'W/"x", {etag}'}).status_code == 304
+
+    response = client.patch(url, json={"title": "Renamed"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    new_etag = response.headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": new_etag}).status_code == 304
+
+    response = client.patch(url, json={"title": "Stale"}, headers={"If-Match": etag})
+    assert response.status_code == 412
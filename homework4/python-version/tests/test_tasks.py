@@ -2,10 +2,29 @@
 Tests for task endpoints.
 """
 
+import asyncio
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
 
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import get_settings
+from app.database import Base, get_read_db
+from app.main import app
+from app.metrics import count_queries
+from app.migrations import backfill_task_categories
+from app.models.task import PriorityEnum, Task
+from app.models.task_tombstone import TaskTombstone
+from app.schemas.task import TaskResponse
+from app.services.events import EVICTED, Broker, EventHub, LocalBroker, load_broker
+from app.utils.pagination import encode_cursor
+from tests.conftest import engine
+
 
 def test_create_task_success(client, test_list):
     """Test creating a new task."""
@@ -210,3 +229,693 @@ def test_cascade_delete_tasks_with_list(client, test_list, test_task):
     # Verify task is also deleted
     response = client.get(f"/api/v1/tasks/{test_task['id']}")
     assert response.status_code == 404
+
+
+def test_get_tasks_in_list_paginated(client):
+    """Test paging through tasks in a list with the next cursor."""
+    list_id = client.post("/api/v1/lists", json={"title": "Paged"}).json()["id"]
+    created = [
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": f"Task {i}"}).json()["id"]
+        for i in range(3)
+    ]
+
+    first = client.get(f"/api/v1/lists/{list_id}/tasks", params={"limit": 2})
+    assert first.status_code == 200
+    assert [t["id"] for t in first.json()] == created[:2]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(f"/api/v1/lists/{list_id}/tasks", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert [t["id"] for t in second.json()] == created[2:]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_batch_tasks(client, query_budget):
+    """Test creating, updating and deleting tasks in one batch request."""
+    list_id = client.post("/api/v1/lists", json={"title": "Batch"}).json()["id"]
+    existing = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Old"}).json()
+    doomed = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Doomed"}).json()
+    missing = "550e8400-e29b-41d4-a716-446655440000"
+
+    # A fixed number of statements whatever the batch size
+    with query_budget(8):
+        response = client.post(f"/api/v1/lists/{list_id}/tasks/batch", json={"operations": [
+            {"op": "create", "data": {"title": "New 1", "categories": ["import"]}},
+            {"op": "create", "data": {"title": "New 2", "priority": "high"}},
+            {"op": "update", "id": existing["id"], "data": {"completed": True}},
+            {"op": "delete", "id": doomed["id"]},
+            {"op": "delete", "id": missing},
+            {"op": "update", "id": "not-a-uuid", "data": {"title": "x"}},
+        ]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [201, 201, 200, 204, 404, 400]
+    assert results[0]["task"]["categories"] == ["import"]
+    assert results[2]["task"]["completed"] is True
+
+    # Created tasks are listed in request order
+    tasks = client.get(f"/api/v1/lists/{list_id}/tasks").json()
+    assert [t["title"] for t in tasks] == ["Old", "New 1", "New 2"]
+    assert client.get(f"/api/v1/tasks/{results[1]['id']}").json()["priority"] == "high"
+    assert client.get(f"/api/v1/tasks/{existing['id']}").json()["completed"] is True
+
+
+def test_batch_tasks_list_not_found(client):
+    """Test batch request against a non-existent list."""
+    fake_uuid = "550e8400-e29b-41d4-a716-446655440000"
+    response = client.post(
+        f"/api/v1/lists/{fake_uuid}/tasks/batch",
+        json={"operations": [{"op": "create", "data": {"title": "Task"}}]},
+    )
+
+    assert response.status_code == 404
+
+
+def test_batch_tasks_without_success_changes_nothing(client):
+    """Test that a batch whose operations all fail leaves the list's validators alone."""
+
+    list_id = client.post("/api/v1/lists", json={"title": "Batch"}).json()["id"]
+    etag = client.get(f"/api/v1/lists/{list_id}/tasks").headers["ETag"]
+    missing = "550e8400-e29b-41d4-a716-446655440000"
+
+    response = client.post(f"/api/v1/lists/{list_id}/tasks/batch", json={"operations": [
+        {"op": "delete", "id": missing},
+        {"op": "update", "id": "not-a-uuid", "data": {"title": "x"}},
+    ]})
+    assert [r["status"] for r in response.json()["results"]] == [404, 400]
+    assert client.get(f"/api/v1/lists/{list_id}/tasks").headers["ETag"] == etag
+    assert client.get(f"/api/v1/lists/{list_id}/changes").json()["revision"] == 0
+
+    # Oversized batches are rejected by request validation
+    operations = [{"op": "delete", "id": missing}] * (get_settings().BATCH_MAX_OPERATIONS + 1)
+    response = client.post(
+        f"/api/v1/lists/{list_id}/tasks/batch", json={"operations": operations}
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "VALIDATION_ERROR"
+
+
+def test_update_task_returns_in_memory_state(client):
+    """Test that write responses carry generated fields without a refresh."""
+    list_id = client.post("/api/v1/lists", json={"title": "Writes"}).json()["id"]
+    created = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Task"}).json()
+    assert created["id"] and created["createdAt"]
+    assert created["updatedAt"] is None
+
+    response = client.patch(f"/api/v1/tasks/{created['id']}", json={"title": "Renamed"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Renamed"
+    assert data["createdAt"] == created["createdAt"]
+    assert data["updatedAt"] is not None
+
+
+def test_update_and_delete_missing_task(client):
+    """Test that single-statement update and delete report 404 for unknown tasks."""
+    fake_uuid = "550e8400-e29b-41d4-a716-446655440000"
+
+    assert client.patch(f"/api/v1/tasks/{fake_uuid}", json={"title": "x"}).status_code == 404
+    assert client.delete(f"/api/v1/tasks/{fake_uuid}").status_code == 404
+
+
+def test_task_serialize_matches_validated_response():
+    """Test that the fast-path serializer produces the same JSON as the Pydantic model."""
+
+    task = Task(
+        id="660e8400-e29b-41d4-a716-446655440001",
+        list_id="550e8400-e29b-41d4-a716-446655440000",
+        title="Buy milk",
+        description=None,
+        completed=False,
+        due_date=datetime(2025, 12, 7, 18, 0, 0, 123456),
+        priority=PriorityEnum.MEDIUM,
+        created_at=datetime(2025, 12, 1, 10, 5),
+        updated_at=None,
+    )
+    task.categories_list = ["groceries", "dairy"]
+
+    fast = orjson.loads(orjson.dumps(TaskResponse.serialize(task)))
+    validated = orjson.loads(TaskResponse.from_orm(task).model_dump_json())
+    assert fast == validated
+
+
+def test_get_tasks_filtered_by_category(client, query_budget):
+    """Test filtering tasks in a list by category."""
+    list_id = client.post("/api/v1/lists", json={"title": "Tagged"}).json()["id"]
+    dairy = client.post(
+        f"/api/v1/lists/{list_id}/tasks", json={"title": "Milk", "categories": ["dairy", "cold"]}
+    ).json()
+    client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Bread", "categories": ["bakery"]})
+    retagged = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Cheese"}).json()
+    client.patch(f"/api/v1/tasks/{retagged['id']}", json={"categories": ["dairy"]})
+
+    with query_budget(3):
+        response = client.get(f"/api/v1/lists/{list_id}/tasks", params={"category": "dairy"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [t["id"] for t in data] == [dairy["id"], retagged["id"]]
+    assert data[0]["categories"] == ["dairy", "cold"]
+    assert data[1]["categories"] == ["dairy"]
+
+
+def test_backfill_task_categories(client):
+    """Test migrating legacy JSON categories into task_categories rows."""
+
+    list_id = client.post("/api/v1/lists", json={"title": "Legacy"}).json()["id"]
+    task = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Old"}).json()
+
+    async def migrate():
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(Task).where(Task.id == task["id"]).values(legacy_categories='["a", "b"]')
+            )
+            first = await backfill_task_categories(conn)
+            second = await backfill_task_categories(conn)
+        return first, second
+
+    assert asyncio.run(migrate()) == (1, 0)
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["categories"] == ["a", "b"]
+
+
+def test_get_tasks_filtered_by_status_priority_and_due_date(client):
+    """Test server-side filters on task listings."""
+    list_id = client.post("/api/v1/lists", json={"title": "Dashboard"}).json()["id"]
+    tasks = [
+        {"title": "Open high", "priority": "high", "dueDate": "2025-12-05T10:00:00Z"},
+        {"title": "Done high", "priority": "high", "completed": True},
+        {"title": "Open low", "priority": "low", "dueDate": "2025-12-20T10:00:00Z"},
+        {"title": "Open high late", "priority": "high", "dueDate": "2026-01-10T10:00:00Z"},
+    ]
+    ids = [client.post(f"/api/v1/lists/{list_id}/tasks", json=t).json()["id"] for t in tasks]
+
+    response = client.get(
+        f"/api/v1/lists/{list_id}/tasks", params={"completed": "false", "priority": "high"}
+    )
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()] == [ids[0], ids[3]]
+
+    response = client.get(
+        f"/api/v1/lists/{list_id}/tasks",
+        params={"dueAfter": "2025-12-05T10:00:00", "dueBefore": "2026-01-01T00:00:00"},
+    )
+    assert [t["id"] for t in response.json()] == [ids[0], ids[2]]
+
+
+def test_get_tasks_sorted_with_cursor(client):
+    """Test sorting by due date descending, with NULLs last, across pages."""
+    list_id = client.post("/api/v1/lists", json={"title": "Sorted"}).json()["id"]
+    due_dates = ["2025-12-02T00:00:00Z", None, "2025-12-03T00:00:00Z", None, "2025-12-01T00:00:00Z"]
+    ids = [
+        client.post(
+            f"/api/v1/lists/{list_id}/tasks", json={"title": f"Task {i}", "dueDate": due}
+        ).json()["id"]
+        for i, due in enumerate(due_dates)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"sort": "-dueDate", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(f"/api/v1/lists/{list_id}/tasks", params=params)
+        assert response.status_code == 200
+        seen += [t["id"] for t in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen[:3] == [ids[2], ids[0], ids[4]]
+    assert sorted(seen[3:]) == sorted([ids[1], ids[3]])
+
+    # A cursor is tied to the sort it was issued for
+    first = client.get(f"/api/v1/lists/{list_id}/tasks", params={"sort": "-dueDate", "limit": 2})
+    response = client.get(
+        f"/api/v1/lists/{list_id}/tasks",
+        params={"sort": "priority", "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert response.status_code == 400
+    assert response.headers["X-Error-Code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.parametrize(
+    "sort,value,row_id",
+    [
+        ("title", [1], "x"),
+        ("title", {"a": 1}, "x"),
+        ("title", 1, "x"),
+        ("title", None, "x"),
+        ("title", "Task", ["x"]),
+        ("priority", "HIGH", "x"),
+        ("priority", True, "x"),
+        ("priority", 7, "x"),
+        ("createdAt", 12, "x"),
+        ("createdAt", "yesterday", "x"),
+    ],
+)
+def test_get_tasks_forged_cursor(client, sort, value, row_id):
+    """Test that a cursor whose values do not fit the sort column is a 400."""
+    list_id = client.post("/api/v1/lists", json={"title": "Forged"}).json()["id"]
+    client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Task"})
+    response = client.get(
+        f"/api/v1/lists/{list_id}/tasks",
+        params={"sort": sort, "cursor": encode_cursor(sort, value, row_id)},
+    )
+
+    assert response.status_code == 400
+    assert response.headers["X-Error-Code"] == "INVALID_CURSOR"
+
+
+def test_get_tasks_sorted_by_priority(client):
+    """Test that priority sorts by rank rather than by name."""
+    list_id = client.post("/api/v1/lists", json={"title": "Ranked"}).json()["id"]
+    for priority in ["medium", "high", None, "low"]:
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "t", "priority": priority})
+
+    response = client.get(f"/api/v1/lists/{list_id}/tasks", params={"sort": "-priority"})
+
+    assert [t["priority"] for t in response.json()] == ["high", "medium", "low", None]
+
+
+def test_get_tasks_sparse_fields(client):
+    """Test that ?fields= returns only the requested fields."""
+    list_id = client.post("/api/v1/lists", json={"title": "Sparse"}).json()["id"]
+    client.post(
+        f"/api/v1/lists/{list_id}/tasks", json={"title": "Milk", "categories": ["dairy"]}
+    )
+
+    response = client.get(f"/api/v1/lists/{list_id}/tasks", params={"fields": "title,categories"})
+    assert response.status_code == 200
+    assert response.json() == [{"title": "Milk", "categories": ["dairy"]}]
+
+    response = client.get(f"/api/v1/lists/{list_id}/tasks", params={"fields": "title,secret"})
+    assert response.status_code == 400
+    assert response.headers["X-Error-Code"] == "VALIDATION_ERROR"
+
+
+def test_search_tasks(client, query_budget):
+    """Test ranked full-text search, kept in sync with task writes."""
+    list_id = client.post("/api/v1/lists", json={"title": "Errands"}).json()["id"]
+    milk = client.post(
+        f"/api/v1/lists/{list_id}/tasks",
+        json={"title": "Buy milk", "description": "Milk from the farm shop, semi-skimmed milk"},
+    ).json()
+    bread = client.post(
+        f"/api/v1/lists/{list_id}/tasks", json={"title": "Bread", "description": "and milk"}
+    ).json()
+    client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Call plumber"})
+
+    with query_budget(2):
+        response = client.get("/api/v1/tasks/search", params={"q": "milk"})
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()] == [milk["id"], bread["id"]]
+
+    # Prefix match on the last word, stemming, and pagination
+    response = client.get("/api/v1/tasks/search", params={"q": "plumb", "limit": 1})
+    assert [t["title"] for t in response.json()] == ["Call plumber"]
+    assert "X-Next-Cursor" not in response.headers
+    first = client.get("/api/v1/tasks/search", params={"q": "milk", "limit": 1})
+    second = client.get(
+        "/api/v1/tasks/search",
+        params={"q": "milk", "limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert [t["id"] for t in second.json()] == [bread["id"]]
+
+    # Updates and deletes are reflected immediately
+    client.patch(f"/api/v1/tasks/{bread['id']}", json={"description": "and butter"})
+    client.delete(f"/api/v1/tasks/{milk['id']}")
+    assert client.get("/api/v1/tasks/search", params={"q": "milk"}).json() == []
+    assert [t["id"] for t in client.get("/api/v1/tasks/search", params={"q": "butter"}).json()] == [
+        bread["id"]
+    ]
+
+    # Operators in user input are treated as plain words
+    response = client.get("/api/v1/tasks/search", params={"q": '"butter" OR NEAR(*'})
+    assert response.status_code == 200
+    response = client.get("/api/v1/tasks/search", params={"q": "!!"})
+    assert response.status_code == 400
+
+
+def test_search_survives_renumbered_task_rowids(client, db):
+    """Test that the SQLite search index does not depend on the rowids of tasks."""
+
+    list_id = client.post("/api/v1/lists", json={"title": "Errands"}).json()["id"]
+    tasks = [
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": title}).json()
+        for title in ("Buy milk", "Call plumber", "Fix sink")
+    ]
+
+    async def renumber():
+        # As VACUUM or a batch-mode copy of the tasks table may do
+        await db.execute(text("UPDATE tasks SET rowid = rowid + 1000"))
+        await db.execute(text("INSERT INTO tasks_fts(tasks_fts) VALUES ('integrity-check')"))
+        await db.commit()
+
+    asyncio.run(renumber())
+
+    def search(q):
+        return [t["id"] for t in client.get("/api/v1/tasks/search", params={"q": q}).json()]
+
+    assert search("plumber") == [tasks[1]["id"]]
+    client.patch(f"/api/v1/tasks/{tasks[2]['id']}", json={"title": "Fix plumbing"})
+    client.delete(f"/api/v1/tasks/{tasks[1]['id']}")
+    assert search("plumb") == [tasks[2]["id"]]
+    assert search("milk") == [tasks[0]["id"]]
+
+
+def test_get_task_conditional(client):
+    """Test ETag / Last-Modified validators and 304 responses for a task."""
+    list_id = client.post("/api/v1/lists", json={"title": "Cached"}).json()["id"]
+    task = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Poll me"}).json()
+
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    response = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    response = client.get(
+        f"/api/v1/tasks/{task['id']}", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    client.patch(f"/api/v1/tasks/{task['id']}", json={"title": "Changed"})
+    response = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_get_tasks_in_list_conditional(client):
+    """Test that a task listing's ETag changes with any task in the list and with the query."""
+    list_id = client.post("/api/v1/lists", json={"title": "Polled"}).json()["id"]
+    task = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "One"}).json()
+    url = f"/api/v1/lists/{list_id}/tasks"
+
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, params={"completed": "true"}).headers["ETag"] != etag
+
+    client.delete(f"/api/v1/tasks/{task['id']}")
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert response.headers["ETag"] != etag
+
+
+def test_update_task_if_match(client):
+    """Test optimistic concurrency with If-Match on PATCH."""
+    list_id = client.post("/api/v1/lists", json={"title": "Shared"}).json()["id"]
+    task = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Draft"}).json()
+    etag = client.get(f"/api/v1/tasks/{task['id']}").headers["ETag"]
+
+    response = client.patch(
+        f"/api/v1/tasks/{task['id']}", json={"title": "Mine"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # A second writer holding the old ETag is rejected
+    response = client.patch(
+        f"/api/v1/tasks/{task['id']}", json={"title": "Theirs"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 412
+    assert response.headers["X-Error-Code"] == "PRECONDITION_FAILED"
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["title"] == "Mine"
+
+
+def test_list_changes_feed(client, query_budget):
+    """Test delta sync: only tasks written or deleted since a revision are returned."""
+    list_id = client.post("/api/v1/lists", json={"title": "Synced"}).json()["id"]
+    url = f"/api/v1/lists/{list_id}/changes"
+    keep = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Keep"}).json()
+    edit = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Edit"}).json()
+    drop = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Drop"}).json()
+
+    with query_budget(4):
+        full = client.get(url).json()
+    assert full["revision"] == 3
+    assert [t["id"] for t in full["tasks"]] == [keep["id"], edit["id"], drop["id"]]
+    assert full["deleted"] == []
+
+    client.patch(f"/api/v1/tasks/{edit['id']}", json={"title": "Edited"})
+    client.delete(f"/api/v1/tasks/{drop['id']}")
+    client.post(
+        f"/api/v1/lists/{list_id}/tasks/batch",
+        json={"operations": [{"op": "create", "data": {"title": "Batched"}}]},
+    )
+
+    delta = client.get(url, params={"since": full["revision"]}).json()
+    assert delta["revision"] == 6
+    assert [t["title"] for t in delta["tasks"]] == ["Edited", "Batched"]
+    assert delta["deleted"] == [drop["id"]]
+
+    assert client.get(url, params={"since": delta["revision"]}).json() == {
+        "revision": 6, "tasks": [], "deleted": []
+    }
+
+
+def test_list_changes_feed_prunes_old_tombstones(client, db, monkeypatch):
+    """Test that old deletions are pruned and clients syncing from before them must resync."""
+    monkeypatch.setattr(get_settings(), "TOMBSTONE_RETENTION_REVISIONS", 2)
+    list_id = client.post("/api/v1/lists", json={"title": "Pruned"}).json()["id"]
+    url = f"/api/v1/lists/{list_id}/changes"
+    tasks = [
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": f"T{i}"}).json()
+        for i in range(3)
+    ]
+    for task in tasks:
+        client.delete(f"/api/v1/tasks/{task['id']}")
+
+    async def tombstones():
+        return sorted((await db.scalars(select(TaskTombstone.task_id))).all())
+
+    # Revisions 4-6 deleted the tasks; only the last two deletions are kept
+    assert asyncio.run(tombstones()) == sorted(task["id"] for task in tasks[1:])
+
+    response = client.get(url, params={"since": 3})
+    assert response.status_code == 410
+    assert response.headers["X-Error-Code"] == "RESYNC_REQUIRED"
+
+    response = client.get(url, params={"since": 4})
+    assert response.status_code == 200
+    assert response.json()["deleted"] == [tasks[1]["id"], tasks[2]["id"]]
+
+    # A cursor that has fallen behind the horizon is refused too
+    cursor = encode_cursor("changes", 4, tasks[0]["id"])
+    response = client.get(url, params={"since": 4, "cursor": cursor})
+    assert response.status_code == 410
+
+
+def test_list_changes_feed_pagination(client):
+    """Test that a large delta is paged with a cursor without losing changes."""
+    list_id = client.post("/api/v1/lists", json={"title": "Busy"}).json()["id"]
+    client.post(
+        f"/api/v1/lists/{list_id}/tasks/batch",
+        json={"operations": [{"op": "create", "data": {"title": f"T{i}"}} for i in range(5)]},
+    )
+    doomed = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Doomed"}).json()
+    client.delete(f"/api/v1/tasks/{doomed['id']}")
+
+    seen, deleted, cursor = [], [], None
+    while True:
+        params = {"since": 0, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(f"/api/v1/lists/{list_id}/changes", params=params)
+        assert response.status_code == 200
+        seen += [t["title"] for t in response.json()["tasks"]]
+        deleted += response.json()["deleted"]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert sorted(seen) == ["T0", "T1", "T2", "T3", "T4"]
+    assert deleted == [doomed["id"]]
+
+
+def test_task_events_websocket(client):
+    """Test that task writes are pushed to subscribers of the list."""
+    list_id = client.post("/api/v1/lists", json={"title": "Live"}).json()["id"]
+
+    with client.websocket_connect(f"/api/v1/lists/{list_id}/ws") as ws:
+        task = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Pushed"}).json()
+        created = ws.receive_json()
+        assert created["type"] == "task.created"
+        assert created["revision"] == 1
+        assert created["task"]["id"] == task["id"]
+
+        client.patch(f"/api/v1/tasks/{task['id']}", json={"completed": True})
+        updated = ws.receive_json()
+        assert (updated["type"], updated["revision"]) == ("task.updated", 2)
+        assert updated["task"]["completed"] is True
+
+        client.delete(f"/api/v1/tasks/{task['id']}")
+        assert ws.receive_json() == {
+            "type": "task.deleted", "listId": list_id, "revision": 3, "taskId": task["id"]
+        }
+
+        client.delete(f"/api/v1/lists/{list_id}")
+        assert ws.receive_json() == {"type": "list.deleted", "listId": list_id}
+
+
+def test_task_events_subscribe_to_a_just_created_list(client, tmp_path):
+    """Test that subscribing right after creating a list does not depend on replica lag."""
+    lagging = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db", poolclass=NullPool)
+
+    async def create_tables():
+        async with lagging.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def lagging_read_db():
+        async with AsyncSession(lagging) as session:
+            yield session
+
+    asyncio.run(create_tables())
+    app.dependency_overrides[get_read_db] = lagging_read_db
+    list_id = client.post("/api/v1/lists", json={"title": "Fresh"}).json()["id"]
+
+    with client.websocket_connect(f"/api/v1/lists/{list_id}/ws") as ws:
+        client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Pushed"})
+        assert ws.receive_json()["type"] == "task.created"
+
+
+def test_event_hub_evicts_slow_consumer():
+    """Test that a subscriber whose queue fills up is evicted without blocking others."""
+
+    async def scenario():
+        hub = EventHub(max_queue=2)
+        slow = hub.subscribe("list")
+        fast = hub.subscribe("list")
+        other = hub.subscribe("other")
+
+        received = []
+        for revision in range(1, 4):
+            await hub.publish("list", {"type": "task.created", "revision": revision})
+            received.append(await fast.get(timeout=1))
+
+        assert [event["revision"] for event in received] == [1, 2, 3]
+        assert slow.evicted and await slow.get(timeout=1) is EVICTED
+        assert hub.subscriber_count("list") == 1
+        assert await other.get(timeout=0.01) is None
+        assert hub.stats()["evicted"] == 1
+
+    asyncio.run(scenario())
+
+
+class _PublishOnlyBroker:
+    """Broker missing start() and stop(), for test_load_broker_rejects_incomplete_brokers."""
+
+    async def publish(self, list_id, event):
+        pass
+
+
+def test_load_broker_rejects_incomplete_brokers():
+    """Test that EVENT_BROKER classes are checked when loaded, not on first publish."""
+
+    assert isinstance(load_broker("local"), LocalBroker)
+    with pytest.raises(TypeError):
+        load_broker(f"{__name__}:_PublishOnlyBroker")
+
+    class Incomplete(Broker):
+        async def publish(self, list_id, event):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_list_endpoints_have_constant_query_counts(client, query_budget):
+    """Test that listing tasks does not issue per-row queries (no N+1)."""
+    list_id = client.post("/api/v1/lists", json={"title": "Many"}).json()["id"]
+    client.post(
+        f"/api/v1/lists/{list_id}/tasks/batch",
+        json={"operations": [
+            {"op": "create", "data": {"title": f"Task {i}", "categories": ["a", f"c{i}"]}}
+            for i in range(25)
+        ]},
+    )
+
+    with query_budget(3):
+        assert len(client.get(f"/api/v1/lists/{list_id}/tasks").json()) == 25
+    with query_budget(3):
+        client.get(f"/api/v1/lists/{list_id}/tasks", params={"category": "a", "sort": "-title"})
+    with query_budget(4):
+        assert len(client.get(f"/api/v1/lists/{list_id}/changes").json()["tasks"]) == 25
+    with query_budget(2):
+        assert len(client.get("/api/v1/tasks/search", params={"q": "task"}).json()) == 25
+
+
+def test_task_crud_query_budgets(client, query_budget):
+    """Test the statements behind each task CRUD request."""
+    list_id = client.post("/api/v1/lists", json={"title": "Budget"}).json()["id"]
+
+    # Touch the list, insert the task, then one INSERT per category
+    with query_budget(4):
+        response = client.post(
+            f"/api/v1/lists/{list_id}/tasks",
+            json={"title": "Buy milk", "priority": "high", "categories": ["groceries", "dairy"]},
+        )
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    with query_budget(3):
+        assert len(client.get(f"/api/v1/lists/{list_id}/tasks").json()) == 1
+    with query_budget(2):
+        response = client.get(f"/api/v1/tasks/{task_id}")
+    assert response.json()["categories"] == ["groceries", "dairy"]
+    # Update the task, touch the list, read back the categories
+    with query_budget(3):
+        response = client.patch(f"/api/v1/tasks/{task_id}", json={"title": "Buy oat milk"})
+    assert response.json()["title"] == "Buy oat milk"
+    # Touch the list, delete the task, record its tombstone
+    with query_budget(3):
+        assert client.delete(f"/api/v1/tasks/{task_id}").status_code == 204
+
+
+def _query_plan(db, statement):
+    """EXPLAIN QUERY PLAN details for a captured statement, binding NULL to every parameter."""
+
+    async def explain():
+        conn = await db.connection()
+        rows = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple([None] * statement.count("?"))
+        )
+        return [row[-1] for row in rows]
+
+    return asyncio.run(explain())
+
+
+def test_hot_queries_use_indexes(client, db):
+    """Test that list and task reads and cascading deletes never scan a whole table."""
+
+    list_id = client.post("/api/v1/lists", json={"title": "Plans"}).json()["id"]
+    task_id = client.post(f"/api/v1/lists/{list_id}/tasks", json={"title": "Explain"}).json()["id"]
+
+    with count_queries() as counter:
+        client.get("/api/v1/lists")
+        client.get(f"/api/v1/lists/{list_id}/tasks")
+        client.get(f"/api/v1/lists/{list_id}/tasks", params={"completed": False})
+        client.get(f"/api/v1/lists/{list_id}/tasks", params={"priority": "high"})
+        client.get(f"/api/v1/lists/{list_id}/changes", params={"since": 0})
+        client.get(f"/api/v1/tasks/{task_id}")
+    selects = [
+        s for s in counter.statements if s.lstrip().upper().startswith(("SELECT", "WITH"))
+    ]
+    assert selects
+
+    for statement in selects:
+        for detail in _query_plan(db, statement):
+            # "SCAN <table>" without "USING ... INDEX" reads every row
+            assert not (detail.startswith("SCAN ") and "INDEX" not in detail), (
+                f"{detail} in plan for:\n{statement}"
+            )
+
+    # The lookups SQLite runs for ON DELETE CASCADE from users and lists
+    owner_plan = " ".join(_query_plan(db, "SELECT 1 FROM lists WHERE user_id = ?"))
+    assert "ix_lists_user_id_created_at_id" in owner_plan
+    task_plan = " ".join(_query_plan(db, "SELECT 1 FROM tasks WHERE list_id = ?"))
+    assert "USING COVERING INDEX ix_tasks_list_id_" in task_plan